@@ -4,7 +4,7 @@ Configuración central del juego.
 DISEÑO ACTUALIZADO: TEMA MINIMALISTA 'DEEP OCEAN'
 """
 
-from pygame import Color
+from collections import namedtuple
 
 # ============================================================================
 # DIMENSIONES Y TIEMPO
@@ -12,10 +12,13 @@ from pygame import Color
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 768
 FPS = 60
+FRAME_SPIN_MS = 2  # Último tramo del frame que se espera activamente (el resto cede la CPU)
 PANEL_WIDTH = 300  
 GAME_AREA_WIDTH = SCREEN_WIDTH - PANEL_WIDTH
 
-TURN_DURATION_MS = 1000
+TEXT_CACHE_SIZE = 128  # Superficies de texto renderizado que se conservan (LRU)
+DIRTY_RECT_LIMIT = 256  # Con más rects sucios por frame conviene un único flip de pantalla completa
+
 DAY_CYCLE_TURNS = 32
 DAWN_FRACTION = 0.18
 DUSK_FRACTION = 0.68
@@ -44,89 +47,86 @@ POPULATION_LIMITS = {
 # ============================================================================
 
 # --- UI General (Dark Theme) ---
-UI_BG = Color("#1e2124")        # Fondo principal del panel (Gris muy oscuro)
-UI_CARD_BG = Color("#282b30")   # Fondo de tarjetas/secciones (Gris medio)
-UI_BORDER = Color("#36393e")    # Bordes sutiles
+UI_BG = (30, 33, 36)       # Fondo principal del panel (Gris muy oscuro)
+UI_CARD_BG = (40, 43, 48)  # Fondo de tarjetas/secciones (Gris medio)
+UI_BORDER = (54, 57, 62)   # Bordes sutiles
 
 # --- Textos ---
-TEXT_MAIN = Color("#ffffff")    # Blanco puro para lectura importante
-TEXT_SEC = Color("#b9bbbe")     # Gris claro para etiquetas
-TEXT_DIM = Color("#72767d")     # Gris oscuro para placeholders o info menos relevante
-TEXT_ACCENT = Color("#7289da")  # Azul discord-like para títulos destacados
+TEXT_MAIN = (255, 255, 255)    # Blanco puro para lectura importante
+TEXT_SEC = (185, 187, 190)     # Gris claro para etiquetas
+TEXT_DIM = (114, 118, 125)     # Gris oscuro para placeholders o info menos relevante
+TEXT_ACCENT = (114, 137, 218)  # Azul discord-like para títulos destacados
 
 # --- Botones y Acciones ---
-BTN_PRIMARY = Color("#5865f2")  # Azul vibrante (Acción principal: Start/Crear)
-BTN_DANGER = Color("#ed4245")   # Rojo suave (Stop/Borrar)
-BTN_WARNING = Color("#fee75c")  # Amarillo (Pausa)
-BTN_SUCCESS = Color("#3ba55c")  # Verde (Guardar/Confirmar)
-BTN_NEUTRAL = Color("#4f545c")  # Gris botón inactivo o secundario
+BTN_PRIMARY = (88, 101, 242)  # Azul vibrante (Acción principal: Start/Crear)
+BTN_DANGER = (237, 66, 69)    # Rojo suave (Stop/Borrar)
+BTN_WARNING = (254, 231, 92)  # Amarillo (Pausa)
+BTN_SUCCESS = (59, 165, 92)   # Verde (Guardar/Confirmar)
+BTN_NEUTRAL = (79, 84, 92)    # Gris botón inactivo o secundario
 
 # --- Barras de Progreso ---
-BAR_BG = Color("#202225")
-BAR_FILL = Color("#3ba55c")     # Verde genérico
-BAR_SEASON = Color("#5865f2")   # Azul estación
+BAR_BG = (32, 34, 37)
+BAR_FILL = (59, 165, 92)     # Verde genérico
+BAR_SEASON = (88, 101, 242)  # Azul estación
 
 # --- Entidades y Simulación ---
-WHITE = Color(255, 255, 255)
-BLACK = Color(0, 0, 0)
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
 
 # Colores del ambiente (Renderizado)
-WATER_LIGHT = Color(173, 216, 230)
-WATER_DARK = Color(0, 105, 148)
-UI_BLACK = Color(20, 20, 20)
-
-# Colores de UI Legacy
-PANEL_BG = UI_BG
-TEXT_TITLE = TEXT_ACCENT
-TEXT_NORMAL = TEXT_SEC
-SEPARATOR = UI_BORDER
-
-BTN_TEXT = TEXT_MAIN
-BTN_START = BTN_PRIMARY
-BTN_STOP = BTN_DANGER
-BTN_PAUSE = BTN_WARNING
-BTN_RESUME = BTN_PRIMARY
-BTN_PLUS = BTN_NEUTRAL
-BTN_MINUS = BTN_NEUTRAL
+WATER_LIGHT = (173, 216, 230)
+WATER_DARK = (0, 105, 148)
+UI_BLACK = (20, 20, 20)
 
 # Colores de Entidades (Barras estadísticas)
-COLOR_PLANT = Color("#3ba55c")   # Verde
-COLOR_FISH = Color("#00b0f4")    # Cyan
-COLOR_TROUT = Color("#e67e22")   # Naranja
-COLOR_SHARK = Color("#95a5a6")   # Gris tiburón
+COLOR_PLANT = (59, 165, 92)    # Verde
+COLOR_FISH = (0, 176, 244)     # Cyan
+COLOR_TROUT = (230, 126, 34)   # Naranja
+COLOR_SHARK = (149, 165, 166)  # Gris tiburón
 
 # Efectos
-EAT_COLOR = Color(144, 238, 144)
-BIRTH_COLOR = Color(255, 182, 193)
-DEATH_COLOR = Color(160, 160, 160)
-BUBBLE_COLOR = Color(200, 225, 255)
+EAT_COLOR = (144, 238, 144)
+BIRTH_COLOR = (255, 182, 193)
+DEATH_COLOR = (160, 160, 160)
+BUBBLE_COLOR = (200, 225, 255)
 
 # ============================================================================
 # CONFIGURACIÓN DE ESTACIONES
 # ============================================================================
 SEASONS_CONFIG = {
     "Primavera": {
-        "color": Color("#3ba55c"), # Verde
+        "color": (59, 165, 92), # Verde
         "description": "Brotes templados.",
         "modifiers": {"movement": 1.05, "energy_consumption": 0.92},
     },
     "Verano": {
-        "color": Color("#f1c40f"), # Amarillo sol
+        "color": (241, 196, 15), # Amarillo sol
         "description": "Calor intenso.",
         "modifiers": {"movement": 1.08, "energy_consumption": 1.05},
     },
     "Otoño": {
-        "color": Color("#e67e22"), # Naranja hoja
+        "color": (230, 126, 34), # Naranja hoja
         "description": "Corrientes de hojas.",
         "modifiers": {"movement": 0.95, "energy_consumption": 0.98},
     },
     "Invierno": {
-        "color": Color("#3498db"), # Azul hielo
+        "color": (52, 152, 219), # Azul hielo
         "description": "Aguas frías.",
         "modifiers": {"movement": 0.82, "energy_consumption": 1.2},
     },
 }
 
+# Modificadores aplanados por estación: acceso por atributo en el hot path, sin dicts anidados
+SeasonModifiers = namedtuple("SeasonModifiers", "movement energy_consumption")
+NEUTRAL_SEASON = SeasonModifiers(1.0, 1.0)
+SEASON_MODIFIERS = {
+    name: SeasonModifiers(
+        float(season["modifiers"].get("movement", 1.0)),
+        float(season["modifiers"].get("energy_consumption", 1.0)),
+    )
+    for name, season in SEASONS_CONFIG.items()
+}
+
 # Configuración de comportamiento de entidades
 FISH_BASE_SPEED_MIN = 1.0
 FISH_BASE_SPEED_MAX = 2.0
@@ -145,4 +145,8 @@ TROUT_ESCAPE_SPEED_MULTIPLIER = 1.6
 SHARK_HUNGER_THRESHOLD = 0.65
 SHARK_HUNT_RADIUS_RELAXED = 260
 SHARK_HUNT_RADIUS_HUNGRY = 400
-SHARK_TARGET_PERSISTENCE = 480
\ No newline at end of file
+SHARK_TARGET_PERSISTENCE = 480
+SPATIAL_CELL_SIZE = 128  # Lado de celda del índice espacial de vecinos
+AI_THINK_INTERVAL_MIN = 2  # Frames entre decisiones de un animal tranquilo (ni huye ni caza)
+AI_THINK_INTERVAL_MAX = 4
+NIGHT_REST_ENERGY_FRACTION = 0.5  # De noche, con más energía que esta fracción el animal descansa
\ No newline at end of file
@@ -3,14 +3,50 @@ Lógica central del ecosistema.
 Incluye serialización completa (JSON) para guardado/carga.
 """
 
-import pygame
 import random
 import math
 from abc import ABC, abstractmethod
-from typing import List, Dict, Tuple, Optional, Any
+from itertools import chain
+from operator import itemgetter
+from typing import List, Dict, Tuple, Optional, Any, Iterable
 
 import config as cfg
 
+# Funciones usadas en cada frame, resueltas una vez (sin buscar el atributo del módulo en cada llamada)
+_sqrt = math.sqrt
+_random = random.random
+_uniform = random.uniform
+_randint = random.randint
+_randrange = random.randrange
+
+# Derivados de config que se usan en cada frame: se resuelven una vez al importar
+_FISH_SEPARATION_SQ = cfg.FISH_SEPARATION_DISTANCE * cfg.FISH_SEPARATION_DISTANCE
+_SHARK_TARGET_PERSISTENCE_SQ = cfg.SHARK_TARGET_PERSISTENCE * cfg.SHARK_TARGET_PERSISTENCE
+_AREA_CENTER_X = cfg.GAME_AREA_WIDTH / 2
+_AREA_CENTER_Y = cfg.SCREEN_HEIGHT / 2
+_PLANT_MIN = cfg.POPULATION_LIMITS["plantas"]["min"]
+_PLANT_MAX = cfg.POPULATION_LIMITS["plantas"]["max"]
+_BY_DIST2 = itemgetter(0)  # Clave de orden para pares (distancia², entidad)
+# Etiqueta entera por especie (Entity.SPECIES_ID): comparar enteros en vez de isinstance en el hot path
+SPECIES_PLANT = 0
+SPECIES_FISH = 1
+SPECIES_TROUT = 2
+SPECIES_SHARK = 3
+
+# Tamaño (lado) de cada sprite en px; también acota la búsqueda de colisiones
+_PLANT_SIZE = 14
+_FISH_SIZE = 20
+_TROUT_SIZE = 35
+_SHARK_SIZE = 45
+# Estados que deciden en cada frame; el resto piensa cada AI_THINK_INTERVAL_MIN..MAX frames
+_ALWAYS_THINK_STATES = frozenset(("fleeing", "hunting"))
+
+# Eventos del ecosistema: tuplas (tipo, x, y, especie) en lugar de dicts, sin asignar uno por evento.
+# "especie" es quien nace o quien come; None en las muertes.
+EVENT_BIRTH = 0
+EVENT_DEATH = 1
+EVENT_EAT = 2
+
 
 # ==============================
 #        ENTIDADES BASE
@@ -19,6 +55,12 @@ import config as cfg
 class Entity(ABC):
     """Clase base para todas las entidades del juego."""
 
+    SPECIES_ID: int = -1  # cada especie concreta la redefine
+
+    # Atributos fijos (sin __dict__): menos memoria y acceso más rápido en los bucles por frame
+    __slots__ = ("eid", "x", "y", "width", "height", "name", "target_x", "target_y", "direction", "alive", "_cell",
+                 "_max_x", "_max_y")
+
     def __init__(self, x: float, y: float, width: int, height: int, name: str):
         self.eid: int = -1  # asignado por Ecosystem
         self.x = float(x)
@@ -26,58 +68,65 @@ class Entity(ABC):
         self.width = width
         self.height = height
         self.name = name
+        # Límites de posición (el tamaño no cambia): se restan una sola vez
+        self._max_x = cfg.GAME_AREA_WIDTH - width
+        self._max_y = cfg.SCREEN_HEIGHT - height
 
         self.target_x = float(x)
         self.target_y = float(y)
-        self.rect = pygame.Rect(int(x), int(y), width, height)
-
-    def update_position(self):
-        self.rect.x = int(self.x)
-        self.rect.y = int(self.y)
+        self.direction = 0  # -1 izquierda, 1 derecha, 0 sin orientación (plantas)
+        self.alive = True  # False al morir o ser comida; el Ecosystem compacta sus listas
+        self._cell = -1  # Celda actual en su SpatialGrid (la mantiene la rejilla)
 
     def clamp_to_bounds(self):
-        max_x = cfg.GAME_AREA_WIDTH - self.width
-        max_y = cfg.SCREEN_HEIGHT - self.height
-        self.x = max(0, min(self.x, max_x))
-        self.y = max(0, min(self.y, max_y))
-        self.update_position()
+        # Comparaciones directas en lugar de max(0, min(...)): sin llamadas en el caso común (dentro de límites)
+        x, y = self.x, self.y
+        if x < 0: x = 0
+        elif x > self._max_x: x = self._max_x
+        if y < 0: y = 0
+        elif y > self._max_y: y = self._max_y
+        self.x = x
+        self.y = y
 
     def move_towards_target(self, speed: float) -> bool:
-        max_x = cfg.GAME_AREA_WIDTH - self.width
-        max_y = cfg.SCREEN_HEIGHT - self.height
-        self.target_x = max(0, min(self.target_x, max_x))
-        self.target_y = max(0, min(self.target_y, max_y))
-
-        dx = self.target_x - self.x
-        dy = self.target_y - self.y
-        dist = math.hypot(dx, dy)
-
-        if dist < speed or dist < 0.5:
-            self.x = self.target_x
-            self.y = self.target_y
-            self.clamp_to_bounds()
-            if hasattr(self, "direction") and dx != 0:
-                self.direction = 1 if dx > 0 else -1
+        max_x = self._max_x
+        max_y = self._max_y
+        tx, ty = self.target_x, self.target_y
+        if tx < 0: tx = self.target_x = 0
+        elif tx > max_x: tx = self.target_x = max_x
+        if ty < 0: ty = self.target_y = 0
+        elif ty > max_y: ty = self.target_y = max_y
+
+        # Paso de integración sobre locales: una sola escritura de posición al final
+        x, y = self.x, self.y
+        dx = tx - x
+        dy = ty - y
+        d2 = dx * dx + dy * dy
+        if d2 == 0:
+            # Ya está sobre el objetivo (dentro de límites): posición y dirección no cambian
             return True
 
-        if dist > 0:
-            self.x += (dx / dist) * speed
-            self.y += (dy / dist) * speed
+        # Llegada comparada al cuadrado; la única raíz es la del paso normalizado
+        arrived = d2 < speed * speed or d2 < 0.25
+        if arrived:
+            x, y = tx, ty
+        else:
+            step = speed / _sqrt(d2)
+            x += dx * step
+            y += dy * step
 
-        if hasattr(self, "direction") and dx != 0:
+        if dx:
             self.direction = 1 if dx > 0 else -1
 
-        self.clamp_to_bounds()
-        return False
+        # Sin reclamp: origen y objetivo están dentro de límites, y el paso no sobrepasa el objetivo
+        self.x = x
+        self.y = y
+        return arrived
 
     def set_random_position(self):
-        max_x = cfg.GAME_AREA_WIDTH - self.width
-        max_y = cfg.SCREEN_HEIGHT - self.height
-        self.x = random.randint(0, max(0, max_x))
-        self.y = random.randint(0, max(0, max_y))
-        self.target_x = self.x
-        self.target_y = self.y
-        self.update_position()
+        # Un random() por eje (randint hace varias llamadas Python por número)
+        self.x = self.target_x = max(0, self._max_x) * _random()
+        self.y = self.target_y = max(0, self._max_y) * _random()
 
     # -------- SERIALIZACIÓN --------
     def to_dict(self) -> Dict[str, Any]:
@@ -97,12 +146,25 @@ class Entity(ABC):
         self.y = float(data.get("y", self.y))
         self.target_x = float(data.get("target_x", self.x))
         self.target_y = float(data.get("target_y", self.y))
-        self.update_position()
+        # Un guardado de otra resolución puede traer posiciones fuera del área actual
+        self.clamp_to_bounds()
 
 
 class Animal(Entity):
     """Clase base para animales con IA."""
 
+    __slots__ = (
+        "energy", "max_energy", "lifespan", "age",
+        "base_speed", "speed", "base_consumption", "consumption",
+        "state", "target_entity", "season_move_mult", "_pending_target_id", "_think_countdown",
+        "_season_stamp",
+        "hunger_energy", "reproduce_energy", "rest_energy",
+    )
+
+    # Fracciones de max_energy por especie: por debajo de HUNGER busca comida, por encima de REPRODUCE puede reproducirse
+    HUNGER_FRACTION = 0.5
+    REPRODUCE_FRACTION = 0.7
+
     def __init__(
         self,
         x: float,
@@ -120,8 +182,9 @@ class Animal(Entity):
         self.max_energy = float(max_energy)
         self.lifespan = int(lifespan)
         self.age = 0.0
+        self._derive_thresholds()
 
-        self.base_speed = random.uniform(0.5, 1.5)
+        self.base_speed = _uniform(0.5, 1.5)
         self.speed = self.base_speed
 
         # IMPORTANTÍSIMO: estos deben ser coherentes por especie
@@ -133,21 +196,30 @@ class Animal(Entity):
         self.target_entity: Optional[Entity] = None
 
         self.season_move_mult = 1.0
+        self._season_stamp = -1  # Estación con la que se calcularon speed/consumption (-1: pendiente)
         self._pending_target_id: Optional[int] = None  # para reconstrucción en load
+        # Desfasado al azar para que los animales no piensen todos en el mismo frame
+        self._think_countdown = _randrange(cfg.AI_THINK_INTERVAL_MAX)
 
-    def apply_season_modifiers(self, ecosystem: "Ecosystem"):
-        season_name = ecosystem.time_system.get_season()
-        season_cfg = cfg.SEASONS_CONFIG.get(season_name, {})
-        modifiers = season_cfg.get("modifiers", {})
+    def _derive_thresholds(self):
+        """Umbrales absolutos de energía (solo cambian con max_energy): sin multiplicar en cada decisión."""
+        self.hunger_energy = self.max_energy * self.HUNGER_FRACTION
+        self.reproduce_energy = self.max_energy * self.REPRODUCE_FRACTION
+        self.rest_energy = self.max_energy * cfg.NIGHT_REST_ENERGY_FRACTION
 
-        self.season_move_mult = float(modifiers.get("movement", 1.0))
-        cons_mult = float(modifiers.get("energy_consumption", 1.0))
+    def apply_season_modifiers(self, ecosystem: "Ecosystem"):
+        time_system = ecosystem.time_system
+        mods = time_system.season_mods
+        self._season_stamp = time_system.season_index
 
-        self.speed = self.base_speed * self.season_move_mult
-        self.consumption = self.base_consumption * cons_mult
+        self.season_move_mult = mods.movement
+        self.speed = self.base_speed * mods.movement
+        self.consumption = self.base_consumption * mods.energy_consumption
 
     def update(self, delta_time: float, ecosystem: "Ecosystem") -> bool:
-        self.apply_season_modifiers(ecosystem)
+        # Los modificadores solo cambian con la estación: se recalculan al cambiar, no en cada tick
+        if self._season_stamp != ecosystem.time_system.season_index:
+            self.apply_season_modifiers(ecosystem)
 
         self.energy = max(0.0, self.energy - self.consumption * delta_time)
         self.age += delta_time
@@ -155,7 +227,14 @@ class Animal(Entity):
         if self.is_dead():
             return False
 
-        self.decide_action(ecosystem)
+        # LOD de IA: huir y cazar se deciden cada frame; el resto sigue su objetivo entre decisiones
+        if self.state in _ALWAYS_THINK_STATES:
+            self.decide_action(ecosystem)
+        else:
+            self._think_countdown -= 1
+            if self._think_countdown <= 0:
+                self._think_countdown = _randint(cfg.AI_THINK_INTERVAL_MIN, cfg.AI_THINK_INTERVAL_MAX)
+                self.decide_action(ecosystem)
 
         if self.state != "idle":
             self.move_towards_target(self.speed * delta_time * 60)
@@ -165,6 +244,14 @@ class Animal(Entity):
     def is_dead(self) -> bool:
         return self.energy <= 0.0 or self.age >= self.lifespan
 
+    def _rest_at_night(self, ecosystem: "Ecosystem") -> bool:
+        """De noche, un animal bien alimentado se queda quieto: no busca comida, cardumen ni paseo."""
+        if ecosystem.time_system.night and self.energy > self.rest_energy:
+            self.state = "idle"
+            self.target_entity = None
+            return True
+        return False
+
     @abstractmethod
     def decide_action(self, ecosystem: "Ecosystem"):
         pass
@@ -206,6 +293,7 @@ class Animal(Entity):
     def load_animal_state(self, data: Dict[str, Any]):
         self.energy = float(data.get("energy", self.energy))
         self.max_energy = float(data.get("max_energy", self.max_energy))
+        self._derive_thresholds()
         self.lifespan = int(data.get("lifespan", self.lifespan))
         self.age = float(data.get("age", self.age))
 
@@ -214,16 +302,20 @@ class Animal(Entity):
         self.direction = int(data.get("direction", self.direction))
         self.state = data.get("state", self.state)
 
-        # se recalculan en update(), pero dejamos consistente
+        # se recalculan en el próximo update(), pero dejamos consistente
         self.speed = self.base_speed
         self.consumption = self.base_consumption
+        self._season_stamp = -1
 
         self._pending_target_id = data.get("target_id", None)
 
 
 class Plant(Entity):
+    __slots__ = ("energy_value", "growth")
+    SPECIES_ID = SPECIES_PLANT
+
     def __init__(self, x: float, y: float, name: str = "Alga"):
-        super().__init__(x, y, 14, 14, name)
+        super().__init__(x, y, _PLANT_SIZE, _PLANT_SIZE, name)
         self.energy_value = 20.0
         self.growth = 100
 
@@ -254,32 +346,40 @@ class Plant(Entity):
 # ==============================
 
 class Fish(Animal):
+    __slots__ = ()
+    SPECIES_ID = SPECIES_FISH
+    HUNGER_FRACTION = 0.3
+    REPRODUCE_FRACTION = 0.7
+
     def __init__(self, x: float, y: float, name: str = "Pejerrey"):
-        super().__init__(x, y, 20, 20, name, energy=70, max_energy=100, lifespan=120)
-        self.base_speed = random.uniform(cfg.FISH_BASE_SPEED_MIN, cfg.FISH_BASE_SPEED_MAX)
+        super().__init__(x, y, _FISH_SIZE, _FISH_SIZE, name, energy=70, max_energy=100, lifespan=120)
+        self.base_speed = _uniform(cfg.FISH_BASE_SPEED_MIN, cfg.FISH_BASE_SPEED_MAX)
         self.speed = self.base_speed
 
         self.base_consumption = 1.0
         self.consumption = self.base_consumption
 
     def decide_action(self, ecosystem: "Ecosystem"):
-        predators = ecosystem.get_nearby_predators(self, 150)
-        if predators:
-            predator = predators[0]
+        predator = ecosystem.get_nearest_predator(self, 150)
+        if predator is not None:
             dx = self.x - predator.x
             dy = self.y - predator.y
-            dist = math.hypot(dx, dy)
-            if dist > 0:
+            d2 = dx * dx + dy * dy
+            if d2 > 0:
                 flee_distance = 120
-                self.target_x = self.x + (dx / dist) * flee_distance
-                self.target_y = self.y + (dy / dist) * flee_distance
+                scale = flee_distance / _sqrt(d2)
+                self.target_x = self.x + dx * scale
+                self.target_y = self.y + dy * scale
                 self.state = "fleeing"
                 return
 
-        if self.energy < self.max_energy * 0.3:
-            plants = ecosystem.get_nearby_plants(self, 120)
-            if plants:
-                plant = plants[0]
+        # Descansar solo después de vigilar a los depredadores: la huida no se pierde de noche
+        if self._rest_at_night(ecosystem):
+            return
+
+        if self.energy < self.hunger_energy:
+            plant = ecosystem.get_nearest_plant(self, 120)
+            if plant is not None:
                 self.target_x = plant.x
                 self.target_y = plant.y
                 self.state = "eating"
@@ -288,33 +388,39 @@ class Fish(Animal):
 
         school = ecosystem.get_nearby_fish(self, cfg.FISH_SCHOOL_RADIUS)
         if len(school) >= cfg.FISH_SCHOOL_MIN_NEIGHBORS:
-            avg_x = sum(f.x for f in school) / len(school)
-            avg_y = sum(f.y for f in school) / len(school)
-
-            sep_x, sep_y = 0.0, 0.0
+            # Cohesión y separación en una sola pasada sobre el cardumen
+            x, y = self.x, self.y
+            sep2 = _FISH_SEPARATION_SQ
+            sum_x = sum_y = sep_x = sep_y = 0.0
             for other in school:
-                dx = self.x - other.x
-                dy = self.y - other.y
-                d = math.hypot(dx, dy)
-                if 0 < d < cfg.FISH_SEPARATION_DISTANCE:
+                ox, oy = other.x, other.y
+                sum_x += ox
+                sum_y += oy
+                dx = x - ox
+                dy = y - oy
+                d2 = dx * dx + dy * dy
+                if 0 < d2 < sep2:
+                    d = _sqrt(d2)
                     sep_x += dx / d
                     sep_y += dy / d
+            avg_x = sum_x / len(school)
+            avg_y = sum_y / len(school)
 
-            target_x = self.x + (avg_x - self.x) * 0.4 + sep_x * 25
-            target_y = self.y + (avg_y - self.y) * 0.4 + sep_y * 25
+            target_x = x + (avg_x - x) * 0.4 + sep_x * 25
+            target_y = y + (avg_y - y) * 0.4 + sep_y * 25
 
             self.target_x = target_x
             self.target_y = target_y
             self.state = "schooling"
             return
 
-        if random.random() < 0.05:
-            self.target_x = self.x + random.randint(-60, 60)
-            self.target_y = self.y + random.randint(-40, 40)
+        if _random() < 0.05:
+            self.target_x = self.x + _uniform(-60, 60)
+            self.target_y = self.y + _uniform(-40, 40)
             self.state = "moving"
 
     def can_eat(self, other: Entity) -> bool:
-        return isinstance(other, Plant)
+        return other.SPECIES_ID == SPECIES_PLANT
 
     def eat(self, other: Entity) -> float:
         if not self.can_eat(other):
@@ -326,7 +432,7 @@ class Fish(Animal):
         return energy
 
     def can_reproduce(self) -> bool:
-        return self.energy > self.max_energy * 0.7 and self.age > 3 and random.random() < 0.1
+        return self.age > 3 and self.energy > self.reproduce_energy and _random() < 0.1
 
     def reproduce(self) -> Optional["Fish"]:
         if not self.can_reproduce():
@@ -346,9 +452,14 @@ class Fish(Animal):
 
 
 class Trout(Animal):
+    __slots__ = ()
+    SPECIES_ID = SPECIES_TROUT
+    HUNGER_FRACTION = 0.45
+    REPRODUCE_FRACTION = 0.6
+
     def __init__(self, x: float, y: float, name: str = "Trucha"):
-        super().__init__(x, y, 35, 35, name, energy=120, max_energy=180, lifespan=180)
-        self.base_speed = random.uniform(cfg.TROUT_BASE_SPEED_MIN, cfg.TROUT_BASE_SPEED_MAX)
+        super().__init__(x, y, _TROUT_SIZE, _TROUT_SIZE, name, energy=120, max_energy=180, lifespan=180)
+        self.base_speed = _uniform(cfg.TROUT_BASE_SPEED_MIN, cfg.TROUT_BASE_SPEED_MAX)
         self.speed = self.base_speed
 
         self.base_consumption = 1.5
@@ -356,16 +467,16 @@ class Trout(Animal):
 
     def decide_action(self, ecosystem: "Ecosystem"):
         # HUÍR si tiburón en radar (boost parametrizado)
-        sharks = ecosystem.get_nearby_sharks(self, cfg.TROUT_ESCAPE_RADAR)
-        if sharks:
-            shark = sharks[0]
+        shark = ecosystem.get_nearest_shark(self, cfg.TROUT_ESCAPE_RADAR)
+        if shark is not None:
             dx = self.x - shark.x
             dy = self.y - shark.y
-            dist = math.hypot(dx, dy)
-            if dist > 0:
+            d2 = dx * dx + dy * dy
+            if d2 > 0:
                 flee_distance = 140
-                self.target_x = self.x + (dx / dist) * flee_distance
-                self.target_y = self.y + (dy / dist) * flee_distance
+                scale = flee_distance / _sqrt(d2)
+                self.target_x = self.x + dx * scale
+                self.target_y = self.y + dy * scale
                 self.speed = self.base_speed * self.season_move_mult * cfg.TROUT_ESCAPE_SPEED_MULTIPLIER
                 self.state = "fleeing"
                 self.target_entity = None
@@ -373,15 +484,18 @@ class Trout(Animal):
         else:
             self.speed = self.base_speed * self.season_move_mult
 
-        hungry = self.energy < self.max_energy * 0.45
+        if self._rest_at_night(ecosystem):
+            return
+
+        hungry = self.energy < self.hunger_energy
 
-        # Mantener objetivo si sigue vivo
+        # Mantener objetivo si sigue vivo (bandera alive: O(1), sin recorrer ecosystem.fish)
         target: Optional[Fish] = None
-        if hungry and isinstance(self.target_entity, Fish) and self.target_entity in ecosystem.fish:
-            target = self.target_entity
+        current = self.target_entity
+        if hungry and current is not None and current.alive and current.SPECIES_ID == SPECIES_FISH:
+            target = current
         elif hungry:
-            fishes = ecosystem.get_nearby_fish(self, 260)
-            target = fishes[0] if fishes else None
+            target = ecosystem.get_nearest_fish(self, 260)
             self.target_entity = target
         else:
             self.target_entity = None
@@ -390,7 +504,7 @@ class Trout(Animal):
             allies = ecosystem.get_nearby_trout(self, cfg.TROUT_PACK_RADIUS)
 
             if len(allies) >= cfg.TROUT_MIN_ALLIES_FOR_PACK:
-                pack = ecosystem.form_trout_pack(self, cfg.TROUT_PACK_RADIUS, cfg.TROUT_MAX_PACK_SIZE)
+                pack = ecosystem.form_trout_pack(self, allies, cfg.TROUT_MAX_PACK_SIZE)
                 for mate in pack:
                     mate.target_entity = target
                     mate.target_x = target.x
@@ -406,20 +520,24 @@ class Trout(Animal):
         # movimiento relajado cerca de otras truchas
         allies = ecosystem.get_nearby_trout(self, 120)
         if allies:
-            avg_x = sum(t.x for t in allies) / len(allies)
-            avg_y = sum(t.y for t in allies) / len(allies)
-            self.target_x = avg_x + random.randint(-30, 30)
-            self.target_y = avg_y + random.randint(-20, 20)
+            sum_x = sum_y = 0.0
+            for t in allies:
+                sum_x += t.x
+                sum_y += t.y
+            avg_x = sum_x / len(allies)
+            avg_y = sum_y / len(allies)
+            self.target_x = avg_x + _uniform(-30, 30)
+            self.target_y = avg_y + _uniform(-20, 20)
             self.state = "moving"
             return
 
-        if random.random() < 0.03:
-            self.target_x = self.x + random.randint(-80, 80)
-            self.target_y = self.y + random.randint(-60, 60)
+        if _random() < 0.03:
+            self.target_x = self.x + _uniform(-80, 80)
+            self.target_y = self.y + _uniform(-60, 60)
             self.state = "moving"
 
     def can_eat(self, other: Entity) -> bool:
-        return isinstance(other, Fish)
+        return other.SPECIES_ID == SPECIES_FISH
 
     def eat(self, other: Entity) -> float:
         if not self.can_eat(other):
@@ -431,7 +549,7 @@ class Trout(Animal):
         return energy
 
     def can_reproduce(self) -> bool:
-        return self.energy > self.max_energy * 0.6 and self.age > 6 and random.random() < 0.08
+        return self.age > 6 and self.energy > self.reproduce_energy and _random() < 0.08
 
     def reproduce(self) -> Optional["Trout"]:
         if not self.can_reproduce():
@@ -451,53 +569,60 @@ class Trout(Animal):
 
 
 class Shark(Animal):
+    __slots__ = ()
+    SPECIES_ID = SPECIES_SHARK
+    HUNGER_FRACTION = cfg.SHARK_HUNGER_THRESHOLD
+    REPRODUCE_FRACTION = 0.7
+
     def __init__(self, x: float, y: float, name: str = "Tiburón"):
-        super().__init__(x, y, 45, 45, name, energy=200, max_energy=300, lifespan=300)
-        self.base_speed = random.uniform(cfg.SHARK_BASE_SPEED_MIN, cfg.SHARK_BASE_SPEED_MAX)
+        super().__init__(x, y, _SHARK_SIZE, _SHARK_SIZE, name, energy=200, max_energy=300, lifespan=300)
+        self.base_speed = _uniform(cfg.SHARK_BASE_SPEED_MIN, cfg.SHARK_BASE_SPEED_MAX)
         self.speed = self.base_speed
 
         self.base_consumption = 0.8
         self.consumption = self.base_consumption
 
     def decide_action(self, ecosystem: "Ecosystem"):
-        fullness = self.energy / self.max_energy
-        hunt_radius = cfg.SHARK_HUNT_RADIUS_HUNGRY if fullness < cfg.SHARK_HUNGER_THRESHOLD else cfg.SHARK_HUNT_RADIUS_RELAXED
+        # Sin depredadores que vigilar: un tiburón saciado descansa antes de cualquier consulta
+        if self._rest_at_night(ecosystem):
+            return
+
+        hunt_radius = cfg.SHARK_HUNT_RADIUS_HUNGRY if self.energy < self.hunger_energy else cfg.SHARK_HUNT_RADIUS_RELAXED
 
         target: Optional[Trout] = None
 
-        if isinstance(self.target_entity, Trout) and self.target_entity in ecosystem.trout:
-            dx = self.target_entity.x - self.x
-            dy = self.target_entity.y - self.y
-            dist = math.hypot(dx, dy)
-            if dist <= cfg.SHARK_TARGET_PERSISTENCE:
-                target = self.target_entity
+        current = self.target_entity
+        if current is not None and current.alive and current.SPECIES_ID == SPECIES_TROUT:
+            dx = current.x - self.x
+            dy = current.y - self.y
+            # Solo umbral: se compara al cuadrado, sin raíz
+            if dx * dx + dy * dy <= _SHARK_TARGET_PERSISTENCE_SQ:
+                target = current
 
         if target is None:
-            trouts = ecosystem.get_nearby_trout(self, hunt_radius)
-            if trouts:
-                target = trouts[0]
+            target = ecosystem.get_nearest_trout(self, hunt_radius)
+            if target is not None:
                 self.target_entity = target
 
         if target is not None:
             dx = target.x - self.x
             dy = target.y - self.y
-            dist = math.hypot(dx, dy) or 1.0
+            d2 = dx * dx + dy * dy
+            inv = 1.0 / _sqrt(d2) if d2 > 0 else 1.0
 
             lead_factor = 0.3
-            self.target_x = target.x + (dx / dist) * lead_factor * 40
-            self.target_y = target.y + (dy / dist) * lead_factor * 20
+            self.target_x = target.x + dx * inv * lead_factor * 40
+            self.target_y = target.y + dy * inv * lead_factor * 20
             self.state = "hunting"
             return
 
-        if random.random() < 0.02:
-            center_x = cfg.GAME_AREA_WIDTH / 2
-            center_y = cfg.SCREEN_HEIGHT / 2
-            self.target_x = center_x + random.randint(-300, 300)
-            self.target_y = center_y + random.randint(-200, 200)
+        if _random() < 0.02:
+            self.target_x = _AREA_CENTER_X + _uniform(-300, 300)
+            self.target_y = _AREA_CENTER_Y + _uniform(-200, 200)
             self.state = "patrolling"
 
     def can_eat(self, other: Entity) -> bool:
-        return isinstance(other, Trout)
+        return other.SPECIES_ID == SPECIES_TROUT
 
     def eat(self, other: Entity) -> float:
         if not self.can_eat(other):
@@ -509,7 +634,7 @@ class Shark(Animal):
         return energy
 
     def can_reproduce(self) -> bool:
-        return self.energy > self.max_energy * 0.7 and self.age > 8 and random.random() < 0.05
+        return self.age > 8 and self.energy > self.reproduce_energy and _random() < 0.05
 
     def reproduce(self) -> Optional["Shark"]:
         if not self.can_reproduce():
@@ -539,19 +664,47 @@ class TimeSystem:
         self.season_index = 0
         self.day_progress = 0.0
 
+        # Derivados cacheados: se recalculan en update(), las consultas solo leen atributos
+        self.season = cfg.SEASONS_ORDER[0]
+        self.season_mods = cfg.SEASON_MODIFIERS.get(self.season, cfg.NEUTRAL_SEASON)
+        self.time_of_day = "amanecer"
+        self.night = False
+        self.light_factor = 0.1
+
     def _recalculate(self):
-        self.day_progress = (self.turn % cfg.DAY_CYCLE_TURNS) / cfg.DAY_CYCLE_TURNS
-        self.day = int(self.turn // cfg.DAY_CYCLE_TURNS) + 1
-        self.season_index = ((self.day - 1) // cfg.DAYS_PER_SEASON) % len(cfg.SEASONS_ORDER)
+        cycle = cfg.DAY_CYCLE_TURNS
+        turn = self.turn
+        self.day_progress = (turn % cycle) / cycle
+        day = int(turn // cycle) + 1
+        # La estación solo puede cambiar al cambiar de día
+        if day != self.day:
+            self.day = day
+            season_index = ((day - 1) // cfg.DAYS_PER_SEASON) % len(cfg.SEASONS_ORDER)
+            if season_index != self.season_index:
+                self.season_index = season_index
+                self.season = cfg.SEASONS_ORDER[season_index]
+                self.season_mods = cfg.SEASON_MODIFIERS.get(self.season, cfg.NEUTRAL_SEASON)
+        self.time_of_day = self._compute_time_of_day()
+        self.night = self.time_of_day == "noche"
+        self.light_factor = self._compute_light_factor()
 
     def update(self, delta_turns: float = 1.0):
         self.turn += float(delta_turns)
         self._recalculate()
 
     def get_season(self) -> str:
-        return cfg.SEASONS_ORDER[self.season_index]
+        return self.season
 
     def get_time_of_day(self) -> str:
+        return self.time_of_day
+
+    def is_night(self) -> bool:
+        return self.night
+
+    def get_light_factor(self) -> float:
+        return self.light_factor
+
+    def _compute_time_of_day(self) -> str:
         if self.day_progress < cfg.DAWN_FRACTION:
             return "amanecer"
         elif self.day_progress < 0.5:
@@ -561,11 +714,8 @@ class TimeSystem:
         else:
             return "noche"
 
-    def is_night(self) -> bool:
-        return self.get_time_of_day() == "noche"
-
-    def get_light_factor(self) -> float:
-        if self.is_night():
+    def _compute_light_factor(self) -> float:
+        if self.night:
             return 0.1
         elif self.day_progress < cfg.DAWN_FRACTION:
             return 0.1 + 0.9 * (self.day_progress / cfg.DAWN_FRACTION)
@@ -585,6 +735,120 @@ class TimeSystem:
         return ts
 
 
+# ==============================
+#       ÍNDICE ESPACIAL
+# ==============================
+
+class SpatialGrid:
+    """
+    Rejilla uniforme sobre el área de juego para consultas por radio.
+    Se reconstruye completa solo al (re)inicializar; después se mantiene
+    incrementalmente (altas, bajas y cambios de celda). Las consultas solo
+    visitan las celdas que tocan el cuadrado envolvente del círculo.
+    """
+
+    def __init__(self, cell_size: float, width: float, height: float):
+        self.cell_size = float(cell_size)
+        self.cols = int(width // self.cell_size) + 1
+        self.rows = int(height // self.cell_size) + 1
+        self.cells: List[List[Entity]] = [[] for _ in range(self.cols * self.rows)]
+
+    def _index(self, x: float, y: float) -> int:
+        cs, cols = self.cell_size, self.cols
+        cx = min(max(int(x // cs), 0), cols - 1)
+        cy = min(max(int(y // cs), 0), self.rows - 1)
+        return cy * cols + cx
+
+    def rebuild(self, entities: Iterable[Entity]):
+        cs, cols, rows = self.cell_size, self.cols, self.rows
+        cells: List[List[Entity]] = [[] for _ in range(cols * rows)]
+        for e in entities:
+            cx = min(max(int(e.x // cs), 0), cols - 1)
+            cy = min(max(int(e.y // cs), 0), rows - 1)
+            idx = cy * cols + cx
+            e._cell = idx
+            cells[idx].append(e)
+        self.cells = cells
+
+    def insert(self, e: Entity):
+        idx = self._index(e.x, e.y)
+        e._cell = idx
+        self.cells[idx].append(e)
+
+    def remove(self, e: Entity):
+        self.cells[e._cell].remove(e)
+        e._cell = -1
+
+    def refresh(self, entities: Iterable[Entity]):
+        """Reubica solo las entidades que cruzaron a otra celda desde la última vez."""
+        cs, cols, rows, cells = self.cell_size, self.cols, self.rows, self.cells
+        for e in entities:
+            cx = min(max(int(e.x // cs), 0), cols - 1)
+            cy = min(max(int(e.y // cs), 0), rows - 1)
+            idx = cy * cols + cx
+            if idx != e._cell:
+                cells[e._cell].remove(e)
+                cells[idx].append(e)
+                e._cell = idx
+
+    def query_box(self, left: float, top: float, right: float, bottom: float) -> List[Entity]:
+        """Entidades indexadas en las celdas que tocan el rectángulo dado (candidatas a colisión)."""
+        cs, cols, cells = self.cell_size, self.cols, self.cells
+        cx0 = max(int(left // cs), 0)
+        cx1 = min(int(right // cs), cols - 1) + 1
+        cy0 = max(int(top // cs), 0)
+        cy1 = min(int(bottom // cs), self.rows - 1) + 1
+        found: List[Entity] = []
+        for cy in range(cy0, cy1):
+            row = cy * cols
+            for i in range(row + cx0, row + cx1):
+                found.extend(cells[i])
+        return found
+
+    def query_radius(self, x: float, y: float, radius: float, exclude: Optional[Entity] = None) -> List[Tuple[float, Entity]]:
+        """Pares (distancia², entidad) a distancia <= radius de (x, y), en una sola pasada por las celdas."""
+        cs, cols, cells = self.cell_size, self.cols, self.cells
+        cx0 = max(int((x - radius) // cs), 0)
+        cx1 = min(int((x + radius) // cs), cols - 1) + 1
+        cy0 = max(int((y - radius) // cs), 0)
+        cy1 = min(int((y + radius) // cs), self.rows - 1) + 1
+        r2 = radius * radius
+        found: List[Tuple[float, Entity]] = []
+        append = found.append
+        for cy in range(cy0, cy1):
+            row = cy * cols
+            for i in range(row + cx0, row + cx1):
+                for other in cells[i]:
+                    dx = other.x - x
+                    dy = other.y - y
+                    # Distancia al cuadrado: sin raíz para descartar candidatos
+                    d2 = dx * dx + dy * dy
+                    if d2 <= r2 and other is not exclude:
+                        append((d2, other))
+        return found
+
+    def query_nearest(self, x: float, y: float, radius: float, exclude: Optional[Entity] = None) -> Optional[Entity]:
+        """La entidad más cercana a (x, y) dentro de radius, en una pasada y sin armar ni ordenar listas."""
+        cs, cols, cells = self.cell_size, self.cols, self.cells
+        cx0 = max(int((x - radius) // cs), 0)
+        cx1 = min(int((x + radius) // cs), cols - 1) + 1
+        cy0 = max(int((y - radius) // cs), 0)
+        cy1 = min(int((y + radius) // cs), self.rows - 1) + 1
+        best: Optional[Entity] = None
+        best_d2 = radius * radius
+        for cy in range(cy0, cy1):
+            row = cy * cols
+            for i in range(row + cx0, row + cx1):
+                for other in cells[i]:
+                    dx = other.x - x
+                    dy = other.y - y
+                    d2 = dx * dx + dy * dy
+                    if d2 < best_d2 and other is not exclude:
+                        best_d2 = d2
+                        best = other
+        return best
+
+
 # ==============================
 #        ECOSISTEMA
 # ==============================
@@ -597,7 +861,7 @@ class Ecosystem:
         self.sharks: List[Shark] = []
 
         self.time_system = TimeSystem()
-        self.events: List[Dict[str, Any]] = []
+        self.events: List[Tuple[int, float, float, Optional[str]]] = []
         self.turn_count = 0
 
         self.paused = False
@@ -605,11 +869,28 @@ class Ecosystem:
 
         self._next_entity_id = 1
 
+        # Un índice espacial por especie (ver _rebuild_grids y _update_animals para su mantenimiento)
+        self._grids: Dict[str, SpatialGrid] = {
+            key: SpatialGrid(cfg.SPATIAL_CELL_SIZE, cfg.GAME_AREA_WIDTH, cfg.SCREEN_HEIGHT) for key in ("plants", "fish", "trout", "sharks")
+        }
+        # Las plantas no se mueven: su índice solo se reconstruye cuando cambia la lista
+        self._plants_dirty = True
+        # Los animales se indexan completos solo tras initialize/load; luego, incrementalmente
+        self._animals_indexed = False
+
     def _assign_id(self, e: Entity):
         if e.eid == -1:
             e.eid = self._next_entity_id
             self._next_entity_id += 1
 
+    def _spawn_random(self, cls: type, count: int) -> List[Entity]:
+        """Crea count entidades de cls en posiciones aleatorias, ya con id asignado."""
+        spawned: List[Entity] = [cls(0, 0) for _ in range(count)]
+        for e in spawned:
+            self._assign_id(e)
+            e.set_random_position()
+        return spawned
+
     def initialize(self, population_config: Dict[str, int] = None):
         config = population_config or cfg.DEFAULT_POPULATION
 
@@ -618,32 +899,15 @@ class Ecosystem:
         self.trout.clear()
         self.sharks.clear()
         self.events.clear()
+        self._plants_dirty = True
+        self._animals_indexed = False
 
         self._next_entity_id = 1
 
-        for _ in range(config["plantas"]):
-            p = Plant(0, 0)
-            self._assign_id(p)
-            p.set_random_position()
-            self.plants.append(p)
-
-        for _ in range(config["peces"]):
-            f = Fish(0, 0)
-            self._assign_id(f)
-            f.set_random_position()
-            self.fish.append(f)
-
-        for _ in range(config["truchas"]):
-            t = Trout(0, 0)
-            self._assign_id(t)
-            t.set_random_position()
-            self.trout.append(t)
-
-        for _ in range(config["tiburones"]):
-            s = Shark(0, 0)
-            self._assign_id(s)
-            s.set_random_position()
-            self.sharks.append(s)
+        self.plants.extend(self._spawn_random(Plant, config["plantas"]))
+        self.fish.extend(self._spawn_random(Fish, config["peces"]))
+        self.trout.extend(self._spawn_random(Trout, config["truchas"]))
+        self.sharks.extend(self._spawn_random(Shark, config["tiburones"]))
 
         self.time_system = TimeSystem()
         self.turn_count = 0
@@ -659,6 +923,7 @@ class Ecosystem:
         for plant in self.plants:
             plant.grow(delta_time)
 
+        self._rebuild_grids()
         self._update_animals(delta_time)
         self._process_interactions()
         self._balance_populations()
@@ -666,148 +931,175 @@ class Ecosystem:
         self.turn_count += 1
 
     def _update_animals(self, delta_time: float):
-        dead_fish: List[Fish] = []
-        new_fish: List[Fish] = []
-
-        for fish in self.fish:
-            if not fish.update(delta_time, self):
-                dead_fish.append(fish)
-            elif fish.can_reproduce():
-                baby = fish.reproduce()
-                if baby:
-                    self._assign_id(baby)
-                    baby.set_random_position()
-                    new_fish.append(baby)
-                    self.events.append({"type": "birth", "position": (fish.x, fish.y), "species": "pez"})
-
-        dead_trout: List[Trout] = []
-        new_trout: List[Trout] = []
-
-        for trout in self.trout:
-            if not trout.update(delta_time, self):
-                dead_trout.append(trout)
-            elif trout.can_reproduce():
-                baby = trout.reproduce()
-                if baby:
-                    self._assign_id(baby)
-                    baby.set_random_position()
-                    new_trout.append(baby)
-                    self.events.append({"type": "birth", "position": (trout.x, trout.y), "species": "trucha"})
-
-        dead_sharks: List[Shark] = []
-        new_sharks: List[Shark] = []
-
-        for shark in self.sharks:
-            if not shark.update(delta_time, self):
-                dead_sharks.append(shark)
-            elif shark.can_reproduce():
-                baby = shark.reproduce()
+        fish_dead, fish_born = self._step_species(self.fish, "pez", delta_time)
+        trout_dead, trout_born = self._step_species(self.trout, "trucha", delta_time)
+        shark_dead, shark_born = self._step_species(self.sharks, "tiburon", delta_time)
+
+        # Los índices se ajustan tras mover a las tres especies, como antes de separar las pasadas
+        self.fish = self._settle_species(self.fish, fish_dead, fish_born, self._grids["fish"])
+        self.trout = self._settle_species(self.trout, trout_dead, trout_born, self._grids["trout"])
+        self.sharks = self._settle_species(self.sharks, shark_dead, shark_born, self._grids["sharks"])
+
+    def _step_species(self, animals: List[Animal], label: str, delta_time: float) -> Tuple[List[Animal], List[Animal]]:
+        """Una pasada por especie: update, reproducción y recogida de muertos. Retorna (muertos, crías)."""
+        dead: List[Animal] = []
+        born: List[Animal] = []
+        events = self.events
+
+        for animal in animals:
+            if not animal.update(delta_time, self):
+                dead.append(animal)
+            elif animal.can_reproduce():
+                baby = animal.reproduce()
                 if baby:
                     self._assign_id(baby)
                     baby.set_random_position()
-                    new_sharks.append(baby)
-                    self.events.append({"type": "birth", "position": (shark.x, shark.y), "species": "tiburon"})
-
-        for fish in dead_fish:
-            if fish in self.fish:
-                self.fish.remove(fish)
-                self.events.append({"type": "death", "position": (fish.x, fish.y)})
-
-        for trout in dead_trout:
-            if trout in self.trout:
-                self.trout.remove(trout)
-                self.events.append({"type": "death", "position": (trout.x, trout.y)})
-
-        for shark in dead_sharks:
-            if shark in self.sharks:
-                self.sharks.remove(shark)
-                self.events.append({"type": "death", "position": (shark.x, shark.y)})
-
-        self.fish.extend(new_fish)
-        self.trout.extend(new_trout)
-        self.sharks.extend(new_sharks)
+                    born.append(baby)
+                    events.append((EVENT_BIRTH, animal.x, animal.y, label))
+
+        return dead, born
+
+    def _settle_species(
+        self, animals: List[Animal], dead: List[Animal], born: List[Animal], grid: SpatialGrid
+    ) -> List[Animal]:
+        """Aplica muertes y nacimientos a la lista y al índice de una especie."""
+        # Muertes: se marcan y la lista se compacta una sola vez (sin list.remove)
+        for animal in dead:
+            animal.alive = False
+            grid.remove(animal)
+            self.events.append((EVENT_DEATH, animal.x, animal.y, None))
+        if dead:
+            animals = [a for a in animals if a.alive]
+
+        # Los sobrevivientes ya se movieron: solo se reubican los que cambiaron de celda
+        grid.refresh(animals)
+
+        for baby in born:
+            grid.insert(baby)
+        animals.extend(born)
+        return animals
 
     def _process_interactions(self):
+        # Las presas comidas se marcan (alive=False) y se ignoran; cada lista se compacta al final de su pasada.
+        # Colisión AABB en línea sobre las posiciones: una presa toca al depredador si su esquina cae
+        # dentro del rect de este extendido hacia arriba/izquierda por el tamaño de la presa. Esa misma
+        # caja acota las celdas consultadas.
+        # Los índices ya están al día con las posiciones de este update (ver _update_animals).
+        plant_grid = self._grids["plants"]
+        fish_grid = self._grids["fish"]
+        trout_grid = self._grids["trout"]
+
+        eaten = False
         for fish in self.fish:
-            for plant in self.plants[:]:
-                if fish.rect.colliderect(plant.rect):
+            x, y = fish.x, fish.y
+            left, top = x - _PLANT_SIZE, y - _PLANT_SIZE
+            right, bottom = x + fish.width, y + fish.height
+            for plant in plant_grid.query_box(left, top, right, bottom):
+                if left < plant.x < right and top < plant.y < bottom and plant.alive:
                     energy = fish.eat(plant)
                     if energy > 0:
-                        if plant in self.plants:
-                            self.plants.remove(plant)
-                        self.events.append({"type": "eat", "position": (fish.x, fish.y), "energy": energy, "eater": "pez"})
+                        plant.alive = False
+                        eaten = True
+                        self.events.append((EVENT_EAT, fish.x, fish.y, "pez"))
                         break
+        if eaten:
+            self.plants = [p for p in self.plants if p.alive]
+            self._plants_dirty = True
 
+        eaten = False
         for trout in self.trout:
-            for fish in self.fish[:]:
-                if trout.rect.colliderect(fish.rect):
+            x, y = trout.x, trout.y
+            left, top = x - _FISH_SIZE, y - _FISH_SIZE
+            right, bottom = x + trout.width, y + trout.height
+            for fish in fish_grid.query_box(left, top, right, bottom):
+                if left < fish.x < right and top < fish.y < bottom and fish.alive:
                     energy = trout.eat(fish)
                     if energy > 0:
-                        if fish in self.fish:
-                            self.fish.remove(fish)
-                        self.events.append({"type": "eat", "position": (trout.x, trout.y), "energy": energy, "eater": "trucha"})
+                        fish.alive = False
+                        fish_grid.remove(fish)
+                        eaten = True
+                        self.events.append((EVENT_EAT, trout.x, trout.y, "trucha"))
                         break
+        if eaten:
+            self.fish = [f for f in self.fish if f.alive]
 
+        eaten = False
         for shark in self.sharks:
-            for trout in self.trout[:]:
-                if shark.rect.colliderect(trout.rect):
+            x, y = shark.x, shark.y
+            left, top = x - _TROUT_SIZE, y - _TROUT_SIZE
+            right, bottom = x + shark.width, y + shark.height
+            for trout in trout_grid.query_box(left, top, right, bottom):
+                if left < trout.x < right and top < trout.y < bottom and trout.alive:
                     energy = shark.eat(trout)
                     if energy > 0:
-                        if trout in self.trout:
-                            self.trout.remove(trout)
-                        self.events.append({"type": "eat", "position": (shark.x, shark.y), "energy": energy, "eater": "tiburon"})
+                        trout.alive = False
+                        trout_grid.remove(trout)
+                        eaten = True
+                        self.events.append((EVENT_EAT, shark.x, shark.y, "tiburon"))
                         break
+        if eaten:
+            self.trout = [t for t in self.trout if t.alive]
 
     def _balance_populations(self):
-        if len(self.plants) < cfg.POPULATION_LIMITS["plantas"]["min"]:
-            deficit = cfg.POPULATION_LIMITS["plantas"]["min"] - len(self.plants)
-            for _ in range(deficit):
-                plant = Plant(0, 0)
-                self._assign_id(plant)
-                plant.set_random_position()
-                self.plants.append(plant)
-
-        elif len(self.plants) > cfg.POPULATION_LIMITS["plantas"]["max"]:
-            excess = len(self.plants) - cfg.POPULATION_LIMITS["plantas"]["max"]
-            self.plants = self.plants[:-excess] if excess > 0 else []
+        count = len(self.plants)
+        if count < _PLANT_MIN:
+            self.plants.extend(self._spawn_random(Plant, _PLANT_MIN - count))
+            self._plants_dirty = True
+
+        elif count > _PLANT_MAX:
+            del self.plants[_PLANT_MAX:]
+            self._plants_dirty = True
 
     # --------- UTILIDADES DE BÚSQUEDA ----------
-    def get_nearby_entities(self, entity: Entity, radius: float, entity_list: List[Entity]) -> List[Entity]:
-        nearby: List[Entity] = []
-        for other in entity_list:
-            if other == entity:
-                continue
-            dx = other.x - entity.x
-            dy = other.y - entity.y
-            d = math.hypot(dx, dy)
-            if d <= radius:
-                nearby.append(other)
-        nearby.sort(key=lambda e: math.hypot(e.x - entity.x, e.y - entity.y))
-        return nearby
-
-    def get_nearby_plants(self, entity: Entity, radius: float) -> List[Plant]:
-        return self.get_nearby_entities(entity, radius, self.plants)  # type: ignore
+    def _rebuild_grids(self):
+        if self._plants_dirty:
+            self._grids["plants"].rebuild(self.plants)
+            self._plants_dirty = False
+        if not self._animals_indexed:
+            self._grids["fish"].rebuild(self.fish)
+            self._grids["trout"].rebuild(self.trout)
+            self._grids["sharks"].rebuild(self.sharks)
+            self._animals_indexed = True
+
+    def get_nearby_entities(self, entity: Entity, radius: float, grid: SpatialGrid) -> List[Entity]:
+        # Se ordena por la distancia² ya calculada en el filtro (mismo orden que por distancia)
+        pairs = grid.query_radius(entity.x, entity.y, radius, entity)
+        pairs.sort(key=_BY_DIST2)
+        return [other for _, other in pairs]
 
     def get_nearby_fish(self, entity: Entity, radius: float) -> List[Fish]:
-        return self.get_nearby_entities(entity, radius, self.fish)  # type: ignore
+        return self.get_nearby_entities(entity, radius, self._grids["fish"])  # type: ignore
 
     def get_nearby_trout(self, entity: Entity, radius: float) -> List[Trout]:
-        return self.get_nearby_entities(entity, radius, self.trout)  # type: ignore
-
-    def get_nearby_sharks(self, entity: Entity, radius: float) -> List[Shark]:
-        return self.get_nearby_entities(entity, radius, self.sharks)  # type: ignore
-
-    def get_nearby_predators(self, entity: Entity, radius: float) -> List[Animal]:
-        predators: List[Animal] = []
-        if isinstance(entity, Fish):
-            predators.extend(self.get_nearby_trout(entity, radius))
-            predators.extend(self.get_nearby_sharks(entity, radius))
-        elif isinstance(entity, Trout):
-            predators.extend(self.get_nearby_sharks(entity, radius))
-        return predators
-
-    def form_trout_pack(self, leader: Trout, radius: float, max_size: int) -> List[Trout]:
-        allies = self.get_nearby_trout(leader, radius)
+        return self.get_nearby_entities(entity, radius, self._grids["trout"])  # type: ignore
+
+    # Consultas de un solo objetivo: los que solo usan al más cercano no pagan lista ni orden
+    def get_nearest_entity(self, entity: Entity, radius: float, grid: SpatialGrid) -> Optional[Entity]:
+        return grid.query_nearest(entity.x, entity.y, radius, entity)
+
+    def get_nearest_plant(self, entity: Entity, radius: float) -> Optional[Plant]:
+        return self.get_nearest_entity(entity, radius, self._grids["plants"])  # type: ignore
+
+    def get_nearest_fish(self, entity: Entity, radius: float) -> Optional[Fish]:
+        return self.get_nearest_entity(entity, radius, self._grids["fish"])  # type: ignore
+
+    def get_nearest_trout(self, entity: Entity, radius: float) -> Optional[Trout]:
+        return self.get_nearest_entity(entity, radius, self._grids["trout"])  # type: ignore
+
+    def get_nearest_shark(self, entity: Entity, radius: float) -> Optional[Shark]:
+        return self.get_nearest_entity(entity, radius, self._grids["sharks"])  # type: ignore
+
+    def get_nearest_predator(self, entity: Entity, radius: float) -> Optional[Animal]:
+        # Un pez vigila primero a las truchas y, si no hay ninguna en radio, a los tiburones
+        species = entity.SPECIES_ID
+        if species == SPECIES_FISH:
+            return self.get_nearest_trout(entity, radius) or self.get_nearest_shark(entity, radius)
+        if species == SPECIES_TROUT:
+            return self.get_nearest_shark(entity, radius)
+        return None
+
+    def form_trout_pack(self, leader: Trout, allies: List[Trout], max_size: int) -> List[Trout]:
+        """Manada del líder con los aliados más cercanos (lista ya ordenada por distancia)."""
         pack: List[Trout] = [leader]
         for t in allies:
             if len(pack) >= max_size:
@@ -815,6 +1107,10 @@ class Ecosystem:
             pack.append(t)
         return pack
 
+    def iter_entities(self) -> Iterable[Entity]:
+        """Todas las entidades (plantas, peces, truchas, tiburones) sin crear listas intermedias."""
+        return chain(self.plants, self.fish, self.trout, self.sharks)
+
     def get_statistics(self) -> Dict[str, Any]:
         return {
             "plants": len(self.plants),
@@ -851,11 +1147,9 @@ class Ecosystem:
         }
 
     def load_from_dict(self, data: Dict[str, Any]):
-        self.plants.clear()
-        self.fish.clear()
-        self.trout.clear()
-        self.sharks.clear()
         self.events.clear()
+        self._plants_dirty = True
+        self._animals_indexed = False
 
         self.paused = bool(data.get("paused", False))
         self.simulation_speed = float(data.get("simulation_speed", 1.0))
@@ -863,30 +1157,15 @@ class Ecosystem:
         self._next_entity_id = int(data.get("next_entity_id", 1))
         self.time_system = TimeSystem.from_dict(data.get("time_system", {}))
 
-        id_map: Dict[int, Entity] = {}
-
-        for pd in data.get("plants", []):
-            p = Plant.from_dict(pd)
-            id_map[p.eid] = p
-            self.plants.append(p)
-
-        for fd in data.get("fish", []):
-            f = Fish.from_dict(fd)
-            id_map[f.eid] = f
-            self.fish.append(f)
-
-        for td in data.get("trout", []):
-            t = Trout.from_dict(td)
-            id_map[t.eid] = t
-            self.trout.append(t)
+        self.plants = [Plant.from_dict(pd) for pd in data.get("plants", [])]
+        self.fish = [Fish.from_dict(fd) for fd in data.get("fish", [])]
+        self.trout = [Trout.from_dict(td) for td in data.get("trout", [])]
+        self.sharks = [Shark.from_dict(sd) for sd in data.get("sharks", [])]
 
-        for sd in data.get("sharks", []):
-            s = Shark.from_dict(sd)
-            id_map[s.eid] = s
-            self.sharks.append(s)
+        id_map: Dict[int, Entity] = {e.eid: e for e in self.iter_entities()}
 
         # reconstruir referencias target_entity
-        for a in list(self.fish) + list(self.trout) + list(self.sharks):
+        for a in chain(self.fish, self.trout, self.sharks):
             tid = getattr(a, "_pending_target_id", None)
             if isinstance(tid, int):
                 a.target_entity = id_map.get(tid)
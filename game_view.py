@@ -5,10 +5,28 @@ Interfaz Gráfica con ViewModel para desacoplamiento.
 
 import os
 import pygame
+from collections import OrderedDict
 from typing import List, Dict, Tuple, Optional, Any
 from dataclasses import dataclass # Recomendado para DTOs de vista
 import config as cfg
-from game_logic import Ecosystem, Plant, Fish, Trout, Shark
+from game_logic import Ecosystem, Plant, Fish, Trout, Shark, EVENT_BIRTH, EVENT_DEATH, EVENT_EAT
+
+# Sprite y color de respaldo por especie: (clase, imagen, tamaño, color)
+SPECIES_SPRITES = [
+    (Plant, "alga.png", (14, 14), cfg.COLOR_PLANT),
+    (Fish, "pez.png", (20, 20), cfg.COLOR_FISH),
+    (Trout, "trucha.png", (35, 35), cfg.COLOR_TROUT),
+    (Shark, "tiburon.png", (45, 45), cfg.COLOR_SHARK),
+]
+
+# Fuentes que usa la interfaz: (tamaño, negrita)
+UI_FONTS = [(11, False), (12, False), (12, True), (13, False), (13, True), (14, False), (14, True), (16, True), (22, True), (40, True)]
+
+# Ventana descubierta o restaurada: con dirty rects hay que repintar el frame completo
+REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED)
+
+# Únicos eventos que entran a la cola (TEXTINPUT alimenta event.unicode de KEYDOWN)
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.TEXTINPUT, pygame.MOUSEBUTTONDOWN, *REDRAW_EVENTS]
 
 # --- VIEW MODEL (Contrato de datos para la Vista) ---
 @dataclass
@@ -22,6 +40,8 @@ class AssetLoader:
         self.images: Dict[str, pygame.Surface] = {}
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
         self.fonts: Dict[str, pygame.font.Font] = {}
+        # Textos ya rasterizados (LRU): la mayoría no cambia entre frames
+        self.texts: "OrderedDict[Tuple[pygame.font.Font, str, Tuple[int, ...]], pygame.Surface]" = OrderedDict()
 
     def load_image(self, filename: str, size: Tuple[int, int] = None) -> Optional[pygame.Surface]:
         if filename in self.images: return self.images[filename]
@@ -51,9 +71,23 @@ class AssetLoader:
             except: self.fonts[key] = pygame.font.Font(None, size)
         return self.fonts[key]
 
+    def render_text(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        key = (font, text, tuple(color))
+        surf = self.texts.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self.texts[key] = surf
+            if len(self.texts) > cfg.TEXT_CACHE_SIZE:
+                self.texts.popitem(last=False)
+        else:
+            self.texts.move_to_end(key)
+        return surf
+
 class Particle:
-    def __init__(self, x: float, y: float, text: str, color: Tuple[int, int, int]):
+    def __init__(self, x: float, y: float, text: str, color: Tuple[int, int, int], surf: pygame.Surface):
         self.x, self.y, self.text, self.color = x, y, text, color
+        # Copia propia: set_alpha no debe tocar la superficie compartida de la caché de textos
+        self.surf = surf.copy()
         self.life = 60
         self.speed_y = -1.5
 
@@ -62,11 +96,10 @@ class Particle:
         self.life -= 1
         return self.life <= 0
 
-    def draw(self, screen: pygame.Surface, font: pygame.font.Font):
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         alpha = min(255, self.life * 4)
-        surf = font.render(self.text, True, self.color)
-        surf.set_alpha(alpha)
-        screen.blit(surf, (int(self.x), int(self.y)))
+        self.surf.set_alpha(alpha)
+        return screen.blit(self.surf, (int(self.x), int(self.y)))
 
 class GameView:
     def __init__(self):
@@ -74,6 +107,17 @@ class GameView:
         self.clock: Optional[pygame.time.Clock] = None
         self.assets = AssetLoader()
         self.particles: List[Particle] = []
+        self.atlas: Optional[pygame.Surface] = None
+        self.atlas_areas: Dict[str, Tuple[pygame.Rect, pygame.Rect]] = {}
+        self.species_sprites: Dict[type, Tuple[Optional[Tuple[pygame.Rect, pygame.Rect]], Any]] = {}
+
+        # Render por dirty rects
+        self.background: Optional[pygame.Surface] = None
+        self.prev_dirty: List[pygame.Rect] = []
+        self.full_redraw = True
+        self._blit_buf: List[Tuple[pygame.Surface, pygame.Rect, pygame.Rect]] = []
+        self.panel_static: Optional[pygame.Surface] = None
+        self.last_frame_ticks = 0
 
         self.simulation_running = False
         self.simulation_paused = False
@@ -82,7 +126,6 @@ class GameView:
         self.toolbar_buttons: Dict[str, pygame.Rect] = {}
         self.config_buttons: Dict[str, Dict[str, Any]] = {}
         self.config: Dict[str, int] = cfg.DEFAULT_POPULATION.copy()
-        self.turn_progress = 0.0
 
         # Gestión partidas usando VIEWMODEL
         self.save_slots: List[SaveSlotViewModel] = [] # Tipo estricto
@@ -119,23 +162,73 @@ class GameView:
         try:
             pygame.init()
             pygame.display.set_caption("Simulador Ecosistema v2.0")
-            self.screen = pygame.display.set_mode((cfg.SCREEN_WIDTH, cfg.SCREEN_HEIGHT))
+            self.screen = self._create_display()
+            # Movimiento de mouse, ventana, etc. se descartan en SDL antes de crear objetos Event
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(HANDLED_EVENTS)
             self.clock = pygame.time.Clock()
+            self.background = pygame.Surface((cfg.GAME_AREA_WIDTH, cfg.SCREEN_HEIGHT)).convert()
+            self.background.fill(cfg.WATER_DARK)
             pygame.mixer.init()
             self.load_assets()
+            self.build_panel_static()
             return True
         except Exception as e:
             print(f"Error init: {e}")
             return False
 
+    def _create_display(self) -> pygame.Surface:
+        """Ventana acelerada (renderer SDL + vsync); si el driver no la soporta, modo software."""
+        size = (cfg.SCREEN_WIDTH, cfg.SCREEN_HEIGHT)
+        try:
+            return pygame.display.set_mode(size, pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error:
+            return pygame.display.set_mode(size)
+
     def load_assets(self):
-        self.assets.load_image("pez.png", (20, 20))
-        self.assets.load_image("trucha.png", (35, 35))
-        self.assets.load_image("tiburon.png", (45, 45))
-        self.assets.load_image("alga.png", (14, 14))
+        for _, filename, size, _ in SPECIES_SPRITES:
+            self.assets.load_image(filename, size)
+        self.build_atlas([filename for _, filename, _, _ in SPECIES_SPRITES])
+        # Se resuelve una sola vez qué dibuja cada clase (área del atlas o círculo de respaldo)
+        self.species_sprites = {cls: (self.atlas_areas.get(filename), color) for cls, filename, _, color in SPECIES_SPRITES}
+        # Precalentado: el primer SysFont recorre las fuentes del sistema y trabaría los primeros frames
+        for size, bold in UI_FONTS:
+            self.assets.get_font(size, bold)
         for s in ["comer_planta.mp3", "comer.mp3", "morir.mp3", "musica_fondo_mar.mp3"]:
             self.assets.load_sound(s)
 
+    def build_atlas(self, filenames: List[str]):
+        """
+        Empaqueta los sprites en una sola superficie.
+        Fila superior: orientación original. Fila inferior: espejados (dirección -1).
+        """
+        imgs = [(f, self.assets.images[f]) for f in filenames if f in self.assets.images]
+        self.atlas_areas = {}
+        if not imgs:
+            self.atlas = None
+            return
+
+        row_h = max(img.get_height() for _, img in imgs)
+        atlas = pygame.Surface((sum(img.get_width() for _, img in imgs), row_h * 2), pygame.SRCALPHA)
+        x = 0
+        for filename, img in imgs:
+            w, h = img.get_size()
+            atlas.blit(img, (x, 0))
+            atlas.blit(pygame.transform.flip(img, True, False), (x, row_h))
+            self.atlas_areas[filename] = (pygame.Rect(x, 0, w, h), pygame.Rect(x, row_h, w, h))
+            x += w
+        # Formato de pantalla una sola vez: los blits por frame no convierten píxeles
+        self.atlas = atlas.convert_alpha()
+
+    def build_panel_static(self):
+        """Capa fija del panel (fondo, borde y título): se pinta una vez y se blitea por frame."""
+        panel = pygame.Surface(self.panel_rect.size).convert()
+        panel.fill(cfg.UI_BG)
+        pygame.draw.line(panel, cfg.UI_BORDER, (0, 0), (0, cfg.SCREEN_HEIGHT), 2)
+        title = self.assets.render_text(self.assets.get_font(22, True), "SIMULADOR BENYI", cfg.TEXT_ACCENT)
+        panel.blit(title, (15, 20))
+        self.panel_static = panel
+
     # --- CAMBIO IMPORTANTE: Recibe ViewModel, no Dict crudo ---
     def update_save_slots(self, slots: List[SaveSlotViewModel], selected_id: Optional[str] = None):
         self.save_slots = slots
@@ -153,9 +246,16 @@ class GameView:
         self.auto_save_feedback_timer = max(0.0, float(duration))
 
     def handle_events(self) -> Optional[Any]:
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        # El repintado se anota antes de procesar la entrada: un return temprano no lo pierde
+        for event in events:
+            if event.type in REDRAW_EVENTS:
+                self.full_redraw = True
+
+        for event in events:
             if event.type == pygame.QUIT: return "quit"
-            
+            if event.type in REDRAW_EVENTS: continue
+
             if event.type == pygame.KEYDOWN and self.text_input_active:
                 if event.key == pygame.K_RETURN:
                     txt = self.text_input_value.strip()
@@ -271,73 +371,106 @@ class GameView:
                 self.auto_save_feedback = ""
 
     def add_particle(self, x: float, y: float, text: str, color: Tuple[int, int, int]):
-        self.particles.append(Particle(x, y, text, color))
-
-    def process_ecosystem_events(self, events: List[Dict]):
-        for event in events:
-            if event["type"] == "eat":
-                eater = event.get("eater", "")
-                snd = self.assets.load_sound("comer_planta.mp3") if eater == "pez" else self.assets.load_sound("comer.mp3")
-                self.add_particle(event["position"][0], event["position"][1], "+E", cfg.EAT_COLOR)
+        surf = self.assets.render_text(self.assets.get_font(14, True), text, color)
+        self.particles.append(Particle(x, y, text, color, surf))
+
+    def process_ecosystem_events(self, events: List[Tuple[int, float, float, Optional[str]]]):
+        for kind, x, y, species in events:
+            if kind == EVENT_EAT:
+                snd = self.assets.load_sound("comer_planta.mp3") if species == "pez" else self.assets.load_sound("comer.mp3")
+                self.add_particle(x, y, "+E", cfg.EAT_COLOR)
                 if snd: snd.play()
-            elif event["type"] == "birth":
-                self.add_particle(event["position"][0], event["position"][1], "★", cfg.BIRTH_COLOR)
-            elif event["type"] == "death":
-                self.add_particle(event["position"][0], event["position"][1], "†", cfg.DEATH_COLOR)
+            elif kind == EVENT_BIRTH:
+                self.add_particle(x, y, "★", cfg.BIRTH_COLOR)
+            elif kind == EVENT_DEATH:
+                self.add_particle(x, y, "†", cfg.DEATH_COLOR)
                 snd = self.assets.load_sound("morir.mp3")
                 if snd: snd.play()
 
     def render(self, ecosystem: Ecosystem):
-        self.screen.fill(cfg.UI_BLACK)
-        self.draw_game_area(ecosystem)
-        self.draw_particles()
+        # Dirty rects: solo se borra y se envía a pantalla lo que cambió desde el frame anterior.
+        # Con el overlay de pausa (semitransparente) se repinta todo para que no se acumule.
+        full = self.full_redraw or self.simulation_paused
+        if full:
+            self.screen.fill(cfg.UI_BLACK)
+            self.screen.blit(self.background, (0, 0))
+        else:
+            self.screen.blits([(self.background, r, r) for r in self.prev_dirty], doreturn=False)
+
+        dirty = self.draw_game_area(ecosystem)
+        dirty.extend(self.draw_particles())
         self.draw_panel(ecosystem)
+        dirty.append(self.panel_rect)
         if self.simulation_paused: self.draw_pause_overlay()
-        pygame.display.flip()
-        self.clock.tick(cfg.FPS)
-
-    def draw_particles(self):
-        font = self.assets.get_font(14, True)
-        for p in self.particles: p.draw(self.screen, font)
 
-    def draw_game_area(self, ecosystem: Ecosystem):
-        rect = pygame.Rect(0, 0, cfg.GAME_AREA_WIDTH, cfg.SCREEN_HEIGHT)
-        pygame.draw.rect(self.screen, cfg.WATER_DARK, rect)
-        
+        update_rects = self.prev_dirty + dirty
+        # Igual que LayeredDirty: con demasiados rects, un flip completo sale más barato que recortarlos
+        if full or len(update_rects) > cfg.DIRTY_RECT_LIMIT:
+            pygame.display.flip()
+        else:
+            pygame.display.update(update_rects)
+        self.prev_dirty = dirty
+        self.full_redraw = self.simulation_paused
+        self.limit_frame_rate()
+
+    def limit_frame_rate(self):
+        """Espera gruesa con wait (sin ocupar CPU) y ajuste fino con tick_busy_loop (sin sobre-dormir)."""
+        remaining = 1000 // cfg.FPS - (pygame.time.get_ticks() - self.last_frame_ticks)
+        if remaining > cfg.FRAME_SPIN_MS:
+            pygame.time.wait(remaining - cfg.FRAME_SPIN_MS)
+        self.clock.tick_busy_loop(cfg.FPS)
+        self.last_frame_ticks = pygame.time.get_ticks()
+
+    def draw_particles(self) -> List[pygame.Rect]:
+        screen = self.screen
+        return [p.draw(screen) for p in self.particles]
+
+    def draw_game_area(self, ecosystem: Ecosystem) -> List[pygame.Rect]:
+        """Dibuja entidades y etiqueta de partida. Devuelve los rects tocados."""
         # Renderizado de Entidades
-        all_entities = ecosystem.plants + ecosystem.fish + ecosystem.trout + ecosystem.sharks
-        all_entities.sort(key=lambda e: e.y)
-        
+        all_entities = sorted(ecosystem.iter_entities(), key=lambda e: e.y)
+
+        # Todas las especies salen del mismo atlas: un único blits() con (atlas, posición, área).
+        # El buffer persiste entre frames y se sobrescribe en el lugar.
+        blit_buf = self._blit_buf
+        size = len(blit_buf)
+        n = 0
+        dirty: List[pygame.Rect] = []
+        species_sprites = self.species_sprites
+        atlas = self.atlas
         for e in all_entities:
-            img_name = "alga.png" if isinstance(e, Plant) else "pez.png" if isinstance(e, Fish) else "trucha.png" if isinstance(e, Trout) else "tiburon.png"
-            c = cfg.COLOR_PLANT if isinstance(e, Plant) else cfg.COLOR_FISH if isinstance(e, Fish) else cfg.COLOR_TROUT if isinstance(e, Trout) else cfg.COLOR_SHARK
             if e.x <= cfg.GAME_AREA_WIDTH:
-                img = self.assets.load_image(img_name)
-                if img:
-                    if hasattr(e, "direction") and e.direction == -1: img = pygame.transform.flip(img, True, False)
-                    self.screen.blit(img, (int(e.x), int(e.y)))
+                areas, c = species_sprites[e.__class__]
+                if areas:
+                    area = areas[1] if e.direction == -1 else areas[0]
+                    # Destino = posición flotante de la entidad; blits la trunca a píxel entero
+                    item = (atlas, (e.x, e.y), area)
+                    if n < size:
+                        blit_buf[n] = item
+                    else:
+                        blit_buf.append(item)
+                    n += 1
                 else:
-                    pygame.draw.circle(self.screen, c, (int(e.x + e.width / 2), int(e.y + e.height / 2)), e.width // 2)
+                    dirty.append(pygame.draw.circle(self.screen, c, (int(e.x + e.width / 2), int(e.y + e.height / 2)), e.width // 2))
+        del blit_buf[n:]
+        dirty.extend(self.screen.blits(blit_buf))
 
         if self.active_save_name:
             f = self.assets.get_font(16, True)
-            t = f.render(self.active_save_name, True, (255, 255, 255))
+            t = self.assets.render_text(f, self.active_save_name, (255, 255, 255))
             bg = pygame.Surface((t.get_width() + 10, t.get_height() + 6))
             bg.fill((0, 0, 0))
             bg.set_alpha(100)
-            self.screen.blit(bg, (10, 10))
+            dirty.append(self.screen.blit(bg, (10, 10)))
             self.screen.blit(t, (15, 13))
+        return dirty
 
     def draw_panel(self, ecosystem: Ecosystem):
-        pygame.draw.rect(self.screen, cfg.UI_BG, self.panel_rect)
-        pygame.draw.line(self.screen, cfg.UI_BORDER, (self.panel_rect.x, 0), (self.panel_rect.x, cfg.SCREEN_HEIGHT), 2)
-        
+        self.screen.blit(self.panel_static, self.panel_rect)
+
         x, width, curr_y = self.panel_rect.x + 15, cfg.PANEL_WIDTH - 30, 20
-        title = self.assets.get_font(22, True).render("SIMULADOR BENYI", True, cfg.TEXT_ACCENT)
-        self.screen.blit(title, (x, curr_y))
-        
         status = "En ejecución" if self.simulation_running and not self.simulation_paused else "Pausado" if self.simulation_paused else "Detenido"
-        st_surf = self.assets.get_font(14).render(status, True, cfg.TEXT_DIM)
+        st_surf = self.assets.render_text(self.assets.get_font(14), status, cfg.TEXT_DIM)
         self.screen.blit(st_surf, (self.panel_rect.right - st_surf.get_width() - 15, curr_y + 5))
         
         curr_y += 40
@@ -353,7 +486,7 @@ class GameView:
 
         if self.auto_save_feedback:
             f_msg = self.assets.get_font(12)
-            msg_surf = f_msg.render(self.auto_save_feedback, True, cfg.TEXT_ACCENT)
+            msg_surf = self.assets.render_text(f_msg, self.auto_save_feedback, cfg.TEXT_ACCENT)
             bg = pygame.Surface((msg_surf.get_width() + 14, msg_surf.get_height() + 8), pygame.SRCALPHA)
             bg.fill((0, 0, 0, 160))
             x_f, y_f = self.panel_rect.x + 15, cfg.SCREEN_HEIGHT - bg.get_height() - 15
@@ -374,7 +507,7 @@ class GameView:
         rect = pygame.Rect(x, y, w, h)
         pygame.draw.rect(self.screen, cfg.UI_CARD_BG, rect, border_radius=8)
         if title:
-            t = self.assets.get_font(14, True).render(title.upper(), True, cfg.TEXT_SEC)
+            t = self.assets.render_text(self.assets.get_font(14, True), title.upper(), cfg.TEXT_SEC)
             self.screen.blit(t, (x + 10, y + 10))
         return rect
 
@@ -389,13 +522,13 @@ class GameView:
         label, col = ("AUTO: ON", cfg.BTN_SUCCESS) if self.auto_save_enabled else ("AUTO: OFF", cfg.BTN_NEUTRAL)
         self.draw_button_modern(toggle_rect, label, col, True, self.assets.get_font(12, True))
         
-        info_surf = self.assets.get_font(11).render("Guarda solo mientras la simulación está en marcha.", True, cfg.TEXT_DIM)
+        info_surf = self.assets.render_text(self.assets.get_font(11), "Guarda solo mientras la simulación está en marcha.", cfg.TEXT_DIM)
         self.screen.blit(info_surf, (x + padding + 120, inner_y + 6))
         
         self.auto_save_rects["minus"] = self.auto_save_rects["plus"] = None
         if self.auto_save_enabled:
             inner_y += 32
-            self.screen.blit(self.assets.get_font(12).render("Guardar cada (días):", True, cfg.TEXT_MAIN), (x + padding, inner_y + 4))
+            self.screen.blit(self.assets.render_text(self.assets.get_font(12), "Guardar cada (días):", cfg.TEXT_MAIN), (x + padding, inner_y + 4))
             btn_size = 22
             minus = pygame.Rect(x + padding + 135, inner_y, btn_size, btn_size)
             val = pygame.Rect(minus.right + 4, inner_y, 40, btn_size)
@@ -403,7 +536,7 @@ class GameView:
             self.auto_save_rects["minus"], self.auto_save_rects["plus"] = minus, plus
             
             self.draw_mini_btn(minus, "-", True)
-            val_s = self.assets.get_font(12).render(str(self.auto_save_days), True, cfg.TEXT_MAIN)
+            val_s = self.assets.render_text(self.assets.get_font(12), str(self.auto_save_days), cfg.TEXT_MAIN)
             pygame.draw.rect(self.screen, cfg.UI_BG, val, border_radius=4)
             pygame.draw.rect(self.screen, cfg.UI_BORDER, val, 1, border_radius=4)
             self.screen.blit(val_s, val_s.get_rect(center=val.center))
@@ -422,8 +555,8 @@ class GameView:
         
         font_lbl, font_num = self.assets.get_font(13), self.assets.get_font(13, True)
         for lbl, val, mx, col in items:
-            self.screen.blit(font_lbl.render(lbl, True, cfg.TEXT_MAIN), (x + padding, inner_y))
-            num = font_num.render(str(val), True, cfg.TEXT_MAIN)
+            self.screen.blit(self.assets.render_text(font_lbl, lbl, cfg.TEXT_MAIN), (x + padding, inner_y))
+            num = self.assets.render_text(font_num, str(val), cfg.TEXT_MAIN)
             self.screen.blit(num, (x + w - padding - num.get_width(), inner_y))
             inner_y += 18
             bar_w = w - padding * 2
@@ -436,12 +569,12 @@ class GameView:
         inner_y += 15
         
         sc = cfg.SEASONS_CONFIG.get(stats["season"], {}).get("color", cfg.WHITE)
-        self.screen.blit(font_lbl.render(f"Día {stats['day']} - {stats['season']}", True, cfg.TEXT_MAIN), (x + padding, inner_y))
+        self.screen.blit(self.assets.render_text(font_lbl, f"Día {stats['day']} - {stats['season']}", cfg.TEXT_MAIN), (x + padding, inner_y))
         inner_y += 20
         pygame.draw.rect(self.screen, cfg.BAR_BG, (x + padding, inner_y, w - padding * 2, 4), border_radius=2)
         pygame.draw.rect(self.screen, sc, (x + padding, inner_y, int((w - padding * 2) * stats["season_progress"]), 4), border_radius=2)
         inner_y += 15
-        self.screen.blit(font_lbl.render(f"Ciclo: {stats['time_of_day'].capitalize()}", True, cfg.TEXT_DIM), (x + padding, inner_y))
+        self.screen.blit(self.assets.render_text(font_lbl, f"Ciclo: {stats['time_of_day'].capitalize()}", cfg.TEXT_DIM), (x + padding, inner_y))
         return y + h + 15
 
     def draw_section_config(self, x, y, w) -> int:
@@ -453,14 +586,14 @@ class GameView:
         for key, lbl, col in items:
             row = pygame.Rect(x + padding, inner_y, w - padding * 2, 30)
             pygame.draw.circle(self.screen, col, (row.x + 8, row.centery), 4)
-            self.screen.blit(f.render(lbl, True, cfg.TEXT_MAIN), (row.x + 20, row.y + 6))
+            self.screen.blit(self.assets.render_text(f, lbl, cfg.TEXT_MAIN), (row.x + 20, row.y + 6))
             btn_s = 24
             plus = pygame.Rect(row.right - btn_s, row.y + 3, btn_s, btn_s)
             val = pygame.Rect(plus.left - 40, row.y, 40, 30)
             minus = pygame.Rect(val.left - btn_s, row.y + 3, btn_s, btn_s)
             self.config_buttons[key] = {"minus": minus, "plus": plus}
             self.draw_mini_btn(minus, "-", self.config[key] > 0)
-            vt = f.render(str(self.config[key]), True, cfg.TEXT_MAIN)
+            vt = self.assets.render_text(f, str(self.config[key]), cfg.TEXT_MAIN)
             self.screen.blit(vt, vt.get_rect(center=val.center))
             self.draw_mini_btn(plus, "+", self.config[key] < cfg.POPULATION_LIMITS[key]["max"])
             inner_y += 38
@@ -481,7 +614,7 @@ class GameView:
         pygame.draw.rect(self.screen, cfg.UI_BORDER, in_r, 1, border_radius=4)
         ts = self.text_input_value if (self.text_input_active and self.text_input_mode != "rename") else ""
         ph, col = ("Nueva partida..." if not ts else ts, cfg.TEXT_DIM if not ts else cfg.TEXT_MAIN)
-        self.screen.blit(self.assets.get_font(13).render(ph, True, col), (in_r.x + 8, in_r.y + 7))
+        self.screen.blit(self.assets.render_text(self.assets.get_font(13), ph, col), (in_r.x + 8, in_r.y + 7))
         self.draw_button_modern(cr_r, "Crear", cfg.BTN_PRIMARY, True, self.assets.get_font(12, True))
         
         inner_y += 45
@@ -496,7 +629,7 @@ class GameView:
             
             nm = slot.name
             trunc = (nm[:18] + "..") if len(nm) > 18 else nm
-            self.screen.blit(f_slot.render(trunc, True, tc), (row_r.x + 8, row_r.y + 7))
+            self.screen.blit(self.assets.render_text(f_slot, trunc, tc), (row_r.x + 8, row_r.y + 7))
             
             del_r = pygame.Rect(row_r.right - 25, row_r.y + 3, 22, 24)
             ren_r = pygame.Rect(del_r.left - 25, row_r.y + 3, 22, 24)
@@ -504,11 +637,11 @@ class GameView:
             del_col, del_txt = (cfg.BTN_DANGER, "?") if self.pending_delete_id == slot.id else (cfg.BTN_NEUTRAL, "x")
             
             pygame.draw.rect(self.screen, cfg.BTN_NEUTRAL, ren_r, border_radius=3)
-            rs = f_slot.render("r", True, cfg.WHITE)
+            rs = self.assets.render_text(f_slot, "r", cfg.WHITE)
             self.screen.blit(rs, rs.get_rect(center=ren_r.center))
             
             pygame.draw.rect(self.screen, del_col, del_r, border_radius=3)
-            ds = f_slot.render(del_txt, True, cfg.WHITE)
+            ds = self.assets.render_text(f_slot, del_txt, cfg.WHITE)
             self.screen.blit(ds, ds.get_rect(center=del_r.center))
             
             self.save_ui_rects["slots"][slot.id] = {"row": row_r, "rename": ren_r, "delete": del_r}
@@ -523,21 +656,21 @@ class GameView:
     def draw_button_modern(self, rect, text, color, enabled, font):
         draw_col = color if enabled else cfg.BTN_NEUTRAL
         if enabled and rect.collidepoint(pygame.mouse.get_pos()):
-            draw_col = (min(255, draw_col.r + 20), min(255, draw_col.g + 20), min(255, draw_col.b + 20))
+            draw_col = tuple(min(255, c + 20) for c in draw_col)
         pygame.draw.rect(self.screen, draw_col, rect, border_radius=5)
-        surf = font.render(text, True, cfg.TEXT_MAIN if enabled else cfg.TEXT_DIM)
+        surf = self.assets.render_text(font, text, cfg.TEXT_MAIN if enabled else cfg.TEXT_DIM)
         self.screen.blit(surf, surf.get_rect(center=rect.center))
 
     def draw_mini_btn(self, rect, text, enabled):
         pygame.draw.rect(self.screen, cfg.BTN_NEUTRAL if enabled else cfg.UI_BG, rect, border_radius=4)
-        s = self.assets.get_font(16, True).render(text, True, cfg.TEXT_MAIN if enabled else cfg.TEXT_DIM)
+        s = self.assets.render_text(self.assets.get_font(16, True), text, cfg.TEXT_MAIN if enabled else cfg.TEXT_DIM)
         self.screen.blit(s, s.get_rect(center=rect.center))
 
     def draw_pause_overlay(self):
         ov = pygame.Surface((cfg.GAME_AREA_WIDTH, cfg.SCREEN_HEIGHT), pygame.SRCALPHA)
         ov.fill((0, 0, 0, 100))
         self.screen.blit(ov, (0, 0))
-        s = self.assets.get_font(40, True).render("PAUSA", True, cfg.WHITE)
+        s = self.assets.render_text(self.assets.get_font(40, True), "PAUSA", cfg.WHITE)
         bg = pygame.Rect(0, 0, s.get_width() + 60, s.get_height() + 40)
         bg.center = (cfg.GAME_AREA_WIDTH // 2, cfg.SCREEN_HEIGHT // 2)
         pygame.draw.rect(self.screen, cfg.UI_BG, bg, border_radius=15)
@@ -548,6 +681,5 @@ class GameView:
         pygame.mixer.quit()
         pygame.quit()
     
-    def set_turn_progress(self, progress: float): self.turn_progress = progress
     def set_simulation_state(self, running: bool, paused: bool): self.simulation_running, self.simulation_paused = running, paused
     def get_configuration(self) -> Dict[str, int]: return self.config.copy()
\ No newline at end of file
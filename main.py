@@ -9,11 +9,11 @@ import pygame
 import base64
 import pickle
 import random
-from typing import Any, Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List
 import shutil
 import os
+from concurrent.futures import Future, wait
 
-import config as cfg
 from game_logic import Ecosystem
 from game_view import GameView, SaveSlotViewModel
 from save_system import SaveManager
@@ -33,7 +33,6 @@ class GameController:
         self.simulation_paused = False
         
         # Estado del Loop
-        self.next_turn_time = 0
         self.last_time = pygame.time.get_ticks()
 
         # Estado de Sesión
@@ -45,6 +44,14 @@ class GameController:
         self.auto_save_enabled: bool = False
         self.auto_save_interval_days: int = 30
         self._last_auto_saved_day: Optional[int] = None
+        self._pending_save: Optional[Future] = None
+
+        # Comandos simples de la Vista resueltos una sola vez (métodos ya enlazados)
+        self._commands: Dict[str, Callable[[], None]] = {
+            "toggle_pause": self.toggle_pause,
+            "start": self.start_simulation,
+            "stop": self.stop_simulation,
+        }
 
     # ---------------- INIT ----------------
 
@@ -107,9 +114,8 @@ class GameController:
         # Comandos simples (Strings)
         if isinstance(ev, str):
             if ev == "quit": return False
-            if ev == "toggle_pause": self.toggle_pause()
-            if ev == "start": self.start_simulation()
-            if ev == "stop": self.stop_simulation()
+            handler = self._commands.get(ev)
+            if handler: handler()
             return True
 
         # Comandos con Datos (Dicts)
@@ -168,7 +174,6 @@ class GameController:
         
         # Actualizar estado de la Vista
         self.view.set_simulation_state(True, False)
-        self.view.set_turn_progress(0.0)
         self.view.set_active_save_name(self.current_save_name)
 
         # Reset referencia autoguardado
@@ -176,8 +181,6 @@ class GameController:
             stats = self.ecosystem.get_statistics()
             self._last_auto_saved_day = stats.get("day", 0)
 
-        self.next_turn_time = pygame.time.get_ticks() + cfg.TURN_DURATION_MS
-
     def stop_simulation(self):
         if not self.simulation_running:
             return
@@ -188,7 +191,6 @@ class GameController:
         self.ecosystem.set_paused(True)
         
         self.view.set_simulation_state(False, False)
-        self.view.set_turn_progress(0.0)
 
     def toggle_pause(self):
         if not self.simulation_running:
@@ -241,6 +243,7 @@ class GameController:
 
     def action_rename_save(self, save_id: str, new_name: str):
         if not save_id or not new_name: return
+        self._flush_pending_save()
         try:
             new_id = self.save_manager.rename_save(save_id, new_name)
             if self.current_save_id == save_id:
@@ -251,6 +254,7 @@ class GameController:
 
     def action_delete_save(self, save_id: str):
         if not save_id: return
+        self._flush_pending_save()
         self.save_manager.delete_save(save_id)
         if self.current_save_id == save_id:
             self.current_save_id = None
@@ -259,6 +263,7 @@ class GameController:
 
     def action_load_save(self, save_id: str):
         if not save_id: return
+        self._flush_pending_save()
         try:
             bundle = self.save_manager.load(save_id)
             self._apply_loaded_state(bundle)
@@ -275,8 +280,13 @@ class GameController:
             print(f"❌ Error carga: {e}")
 
     def action_manual_overwrite(self, save_id: str):
+        self._flush_pending_save()
         data = self._collect_game_data()
-        self.save_manager.overwrite(save_id, data["meta"], data["state"])
+        try:
+            self.save_manager.overwrite(save_id, data["meta"], data["state"])
+        except Exception as e:
+            print(f"❌ Error guardado manual: {e}")
+            return
         self.refresh_ui_save_slots()
         print("💾 Guardado manual completado.")
 
@@ -315,7 +325,6 @@ class GameController:
         self.simulation_paused = False
         self.ecosystem.set_paused(True)
         self.view.set_simulation_state(False, False)
-        self.view.set_turn_progress(0.0)
 
     def _check_autosave(self):
         if not (self.auto_save_enabled and self.simulation_running and not self.simulation_paused and self.current_save_id):
@@ -327,42 +336,63 @@ class GameController:
             return
 
         if current_day - self._last_auto_saved_day >= self.auto_save_interval_days:
-            self.action_manual_overwrite(self.current_save_id)
+            # Con una escritura aún en curso se espera a que termine (y se informe) antes de lanzar otra
+            if self._pending_save is not None:
+                return
+            # El snapshot se toma aquí; backup y escritura corren en el hilo del SaveManager
+            data = self._collect_game_data()
+            self._pending_save = self.save_manager.overwrite_async(self.current_save_id, data["meta"], data["state"])
             self._last_auto_saved_day = current_day
             self.view.set_auto_save_feedback(f"Autoguardado - Día {current_day}")
 
+    def _poll_pending_save(self):
+        if self._pending_save is None or not self._pending_save.done():
+            return
+        future, self._pending_save = self._pending_save, None
+        try:
+            future.result()
+            self.refresh_ui_save_slots()
+            print("💾 Autoguardado completado.")
+        except Exception as e:
+            print(f"❌ Error autoguardado: {e}")
+
+    def _flush_pending_save(self):
+        """Espera el autoguardado en curso: las operaciones síncronas no se cruzan con él."""
+        if self._pending_save is not None:
+            wait([self._pending_save])
+            self._poll_pending_save()
+
     # ---------------- LOOP PRINCIPAL ----------------
 
     def update(self, delta_time: float):
-        if self.simulation_running and not self.simulation_paused:
-            now = pygame.time.get_ticks()
-            time_until = max(0, self.next_turn_time - now)
-            progress = 1.0 - (time_until / cfg.TURN_DURATION_MS)
-            self.view.set_turn_progress(progress)
-            
-            if now >= self.next_turn_time:
-                self.next_turn_time = now + cfg.TURN_DURATION_MS
-
         self.ecosystem.update(delta_time)
         self.view.process_ecosystem_events(self.ecosystem.events)
         self.view.update_particles(delta_time)
         
+        self._poll_pending_save()
         self._check_autosave()
 
     def run(self):
         if not self.initialize(): return
         self.running = True
+        # Referencias del loop resueltas una vez (locales en vez de atributos por frame)
+        get_ticks = pygame.time.get_ticks
+        handle_events = self.handle_events
+        update = self.update
+        render = self.view.render
+        ecosystem = self.ecosystem
+        last_time = self.last_time
         try:
             while self.running:
-                now = pygame.time.get_ticks()
-                delta = (now - self.last_time) / 1000.0
-                self.last_time = now
+                now = get_ticks()
+                delta = (now - last_time) / 1000.0
+                last_time = self.last_time = now
 
-                if not self.handle_events():
+                if not handle_events():
                     break
                 
-                self.update(delta)
-                self.view.render(self.ecosystem)
+                update(delta)
+                render(ecosystem)
         finally:
             self.shutdown()
 
@@ -370,6 +400,7 @@ class GameController:
         if os.path.exists("__pycache__"):
             try: shutil.rmtree("__pycache__")
             except: pass
+        self.save_manager.close()
         self.view.cleanup()
 
 
@@ -1,9 +1,12 @@
 import os
 import json
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List
 import shutil
+import tempfile
+import threading
 
 class SaveManager:
     """
@@ -16,6 +19,11 @@ class SaveManager:
         os.makedirs(self.save_dir, exist_ok=True)
         os.makedirs(self.backup_dir, exist_ok=True)
 
+        # Un único hilo escritor: las escrituras en segundo plano se aplican en orden
+        # El lock serializa todo acceso a los .json entre ese hilo y el principal
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save-writer")
+
     # ------------------- helpers internos -------------------
 
     def _safe_slug(self, name: str) -> str:
@@ -32,6 +40,21 @@ class SaveManager:
     def _path_for_id(self, save_id: str) -> str:
         return os.path.join(self.save_dir, f"{save_id}.json")
 
+    def _write_json(self, path: str, payload: Dict[str, Any]) -> None:
+        """Escritura atómica: list_saves nunca ve un .json a medio escribir."""
+        # JSON compacto serializado de una vez: usa el codificador en C
+        # (json.dump con indent cae al codificador en Python).
+        text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        # Temporal único por escritura: dos escrituras nunca comparten el mismo .tmp
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=self.save_dir)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
     def _backup_save(self, save_id: str) -> None:
         """Crea un backup del archivo de guardado actual antes de sobrescribirlo."""
         current_path = self._path_for_id(save_id)
@@ -50,21 +73,20 @@ class SaveManager:
 
     def save(self, save_name: str, meta: Dict[str, Any], state: Dict[str, Any]) -> str:
         """Crea un nuevo archivo de guardado. Retorna save_id."""
-        save_id = self._make_save_id(save_name)
-        payload = {
-            "version": 1,
-            "meta": {
-                "save_id": save_id,
-                "save_name": save_name,
-                "saved_at": datetime.now().astimezone().isoformat(timespec="seconds"),
-                **meta,
-            },
-            "state": state,
-        }
-        path = self._path_for_id(save_id)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
-        return save_id
+        with self._lock:
+            save_id = self._make_save_id(save_name)
+            payload = {
+                "version": 1,
+                "meta": {
+                    "save_id": save_id,
+                    "save_name": save_name,
+                    "saved_at": datetime.now().astimezone().isoformat(timespec="seconds"),
+                    **meta,
+                },
+                "state": state,
+            }
+            self._write_json(self._path_for_id(save_id), payload)
+            return save_id
 
     def list_saves(self) -> List[Dict[str, Any]]:
         """Lista guardados con metadatos (ordenados por fecha desc)."""
@@ -99,9 +121,10 @@ class SaveManager:
 
     def load(self, save_id: str) -> Dict[str, Any]:
         """Carga el contenido completo (meta + state)."""
-        path = self._path_for_id(save_id)
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with self._lock:
+            path = self._path_for_id(save_id)
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
 
     def rename_save(self, save_id: str, new_name: str) -> str:
         """
@@ -110,34 +133,35 @@ class SaveManager:
         - Cambia save_id + nombre del archivo.
         Retorna nuevo save_id.
         """
-        old_path = self._path_for_id(save_id)
-        if not os.path.exists(old_path):
-            raise FileNotFoundError(f"No existe guardado con id {save_id}")
+        with self._lock:
+            old_path = self._path_for_id(save_id)
+            if not os.path.exists(old_path):
+                raise FileNotFoundError(f"No existe guardado con id {save_id}")
 
-        with open(old_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+            with open(old_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
 
-        meta = data.get("meta", {})
-        meta["save_name"] = new_name
+            meta = data.get("meta", {})
+            meta["save_name"] = new_name
 
-        new_id = self._make_save_id(new_name)
-        meta["save_id"] = new_id
-        data["meta"] = meta
+            new_id = self._make_save_id(new_name)
+            meta["save_id"] = new_id
+            data["meta"] = meta
 
-        new_path = self._path_for_id(new_id)
-        with open(new_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            new_path = self._path_for_id(new_id)
+            self._write_json(new_path, data)
 
-        if os.path.exists(old_path) and old_path != new_path:
-            os.remove(old_path)
+            if os.path.exists(old_path) and old_path != new_path:
+                os.remove(old_path)
 
-        return new_id
+            return new_id
 
     def delete_save(self, save_id: str) -> None:
         """Elimina definitivamente una partida (archivo .json)."""
-        path = self._path_for_id(save_id)
-        if os.path.exists(path):
-            os.remove(path)
+        with self._lock:
+            path = self._path_for_id(save_id)
+            if os.path.exists(path):
+                os.remove(path)
 
     # ------------------- sobrescribir guardado actual -------------------
 
@@ -146,27 +170,37 @@ class SaveManager:
         Sobrescribe el MISMO archivo (misma partida / mismo save_id).
         Realiza un backup antes de sobrescribir el archivo.
         """
-        # Crear backup antes de sobrescribir
-        self._backup_save(save_id)
+        with self._lock:
+            # Crear backup antes de sobrescribir
+            self._backup_save(save_id)
+
+            path = self._path_for_id(save_id)
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"No existe guardado con id {save_id}")
 
-        path = self._path_for_id(save_id)
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"No existe guardado con id {save_id}")
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+            version = data.get("version", 1)
+            meta = data.get("meta", {})
+            meta["save_id"] = save_id
+            meta["save_name"] = meta.get("save_name", meta_updates.get("save_name", save_id))
+            meta["saved_at"] = datetime.now().astimezone().isoformat(timespec="seconds")
 
-        version = data.get("version", 1)
-        meta = data.get("meta", {})
-        meta["save_id"] = save_id
-        meta["save_name"] = meta.get("save_name", meta_updates.get("save_name", save_id))
-        meta["saved_at"] = datetime.now().astimezone().isoformat(timespec="seconds")
+            for k, v in meta_updates.items():
+                if k not in ("save_id", "saved_at"):
+                    meta[k] = v
 
-        for k, v in meta_updates.items():
-            if k not in ("save_id", "saved_at"):
-                meta[k] = v
+            payload = {"version": version, "meta": meta, "state": state}
+            self._write_json(path, payload)
 
-        payload = {"version": version, "meta": meta, "state": state}
+    def overwrite_async(self, save_id: str, meta_updates: Dict[str, Any], state: Dict[str, Any]) -> Future:
+        """
+        Igual que overwrite, pero en el hilo escritor (backup + serialización + disco fuera del frame).
+        meta/state deben ser un snapshot propio: no se copian.
+        """
+        return self._writer.submit(self.overwrite, save_id, meta_updates, state)
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+    def close(self) -> None:
+        """Espera las escrituras pendientes y libera el hilo escritor."""
+        self._writer.shutdown(wait=True)